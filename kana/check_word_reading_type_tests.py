@@ -5,6 +5,9 @@ try:
 except ImportError:
     from ..utils.logger import Logger
 
+ERROR_LOGGER = Logger("error")
+DEBUG_LOGGER = Logger("debug")
+
 
 def test(
     test_name: str,
@@ -17,7 +20,7 @@ def test(
     Args:
         test_name: Name of the test case.
     """
-    logger = Logger("debug") if debug else Logger("error")
+    logger = DEBUG_LOGGER if debug else ERROR_LOGGER
     result = check_word_reading_type(word, logger=logger)
     if debug:
         print("\n\n")
@@ -27,7 +30,7 @@ def test(
         if ignore_fail:
             return
         # Re-run with logging enabled to see what went wrong
-        check_word_reading_type(word, logger=Logger("debug"))
+        check_word_reading_type(word, logger=DEBUG_LOGGER)
         print(f"""\033[91m{test_name}
 \033[93mExpected: {expected}
 \033[92mGot:      {result}
@@ -14,6 +14,9 @@ try:
 except ImportError:
     from ..utils.logger import Logger
 
+ERROR_LOGGER = Logger("error")
+DEBUG_LOGGER = Logger("debug")
+
 
 RED = "\033[91m"
 YELLOW = "\033[93m"
@@ -145,8 +148,8 @@ def main(test_nums: Optional[list[str]] = None):
                         continue
                 run_test_cases += 1
                 cur_test_num = f"{cur_test_index + 1}.{case_idx + 1}"
-                logger = Logger("debug") if debug else Logger("error")
-                rerun_args = (kanji, sentence, return_type, with_tags_def, Logger("debug"))
+                logger = DEBUG_LOGGER if debug else ERROR_LOGGER
+                rerun_args = (kanji, sentence, return_type, with_tags_def, DEBUG_LOGGER)
                 try:
                     result = kana_highlight(
                         kanji, sentence, return_type, with_tags_def, logger=logger
@@ -179,12 +179,13 @@ def get_conjugated_okuri_with_mecab(
     )
     rest_tokens = tokens[1:]
     added_conjugation_token = False
-    for token in rest_tokens:
+    for token_index, token in enumerate(rest_tokens):
         add_to_conjugated_okuri, was_suru_verb = get_all_conjugation_conditions(
             token,
             rest_tokens,
             word_type,
             logger,
+            token_index,
         )
         if add_to_conjugated_okuri:
             added_conjugation_token = True
@@ -1,4 +1,5 @@
-from typing import Literal
+from functools import lru_cache
+from typing import Literal, Optional
 
 try:
     from mecab_controller.basic_types import (
@@ -34,32 +35,48 @@ OkuriPrefix = Literal["word", "reading"]
 mecab = MecabController()
 
 
-def get_word_type_from_mecab_token(token: MecabParsedToken) -> MecabWordType | None:
-    """Get the MecabWordType from a MecabParsedToken."""
+@lru_cache(maxsize=512)
+def get_word_type_for_part_of_speech(
+    part_of_speech: PartOfSpeech, word_last_char: str
+) -> MecabWordType | None:
+    """Get the MecabWordType for a MeCab part of speech and the last character of the word."""
 
-    if token.part_of_speech == PartOfSpeech.i_adjective or (
+    if part_of_speech == PartOfSpeech.i_adjective or (
         # i-adjective inflected to く gets categorized as an adverb
-        token.part_of_speech == PartOfSpeech.adverb
-        and token.word.endswith("く")
+        part_of_speech == PartOfSpeech.adverb
+        and word_last_char == "く"
     ):
         return "i_adjective"
-    if token.part_of_speech == PartOfSpeech.noun and (token.word.endswith("か")):
+    if part_of_speech == PartOfSpeech.noun and word_last_char == "か":
         return "na_adjective"
-    if token.part_of_speech == PartOfSpeech.verb:
+    if part_of_speech == PartOfSpeech.verb:
         return "verb"
-    if token.part_of_speech == PartOfSpeech.adverb:
+    if part_of_speech == PartOfSpeech.adverb:
         return "adverb"
     # Need to check nouns for words like 止め or 恥ずかしげな
-    if token.part_of_speech == PartOfSpeech.noun:
+    if part_of_speech == PartOfSpeech.noun:
         return "noun"
     return None
 
 
+def get_word_type_from_mecab_token(token: MecabParsedToken) -> MecabWordType | None:
+    """Get the MecabWordType from a MecabParsedToken."""
+    # Only the part of speech and the last character of the word affect the result, so cache on
+    # those as there are few of them
+    return get_word_type_for_part_of_speech(token.part_of_speech, token.word[-1:])
+
+
 def verb_conjugation_conditions(
-    token: MecabParsedToken, all_tokens: list[MecabParsedToken]
+    token: MecabParsedToken,
+    all_tokens: list[MecabParsedToken],
+    token_index: Optional[int] = None,
 ) -> bool:
-    """Check if the token meets verb conjugation conditions."""
-    token_index = all_tokens.index(token)
+    """
+    Check if the token meets verb conjugation conditions. Pass token_index when iterating
+    all_tokens to avoid searching the list for the token.
+    """
+    if token_index is None:
+        token_index = all_tokens.index(token)
     prev_prev_token = all_tokens[token_index - 2] if token_index > 1 else None
     prev_token = all_tokens[token_index - 1] if token_index > 0 else None
     next_token = all_tokens[token_index + 1] if token_index < len(all_tokens) - 1 else None
@@ -113,8 +130,12 @@ def get_all_conjugation_conditions(
     all_tokens: list[MecabParsedToken],
     word_type: MecabWordType,
     logger: Logger = Logger("error"),
+    token_index: Optional[int] = None,
 ) -> tuple[bool, bool]:
-    """Check if the token meets any conjugation conditions."""
+    """
+    Check if the token meets any conjugation conditions. Pass token_index when iterating
+    all_tokens to avoid searching the list for the token.
+    """
     add_to_conjugated_okuri = False
     is_suru_verb = False
     if token.word in ["だろう", "でしょう", "なら", "から"]:
@@ -124,7 +145,7 @@ def get_all_conjugation_conditions(
             token.part_of_speech == PartOfSpeech.bound_auxiliary
             and token.inflection_type is not None
             and token.headword not in ["だ", "です"]
-        ) or verb_conjugation_conditions(token, all_tokens):
+        ) or verb_conjugation_conditions(token, all_tokens, token_index):
             add_to_conjugated_okuri = True
             if token.headword == "する":
                 is_suru_verb = True
@@ -159,7 +180,7 @@ def get_all_conjugation_conditions(
                 token.part_of_speech == PartOfSpeech.bound_auxiliary
                 and token.headword not in ["だ", "です"]
             )
-            or verb_conjugation_conditions(token, all_tokens)
+            or verb_conjugation_conditions(token, all_tokens, token_index)
             or (token.part_of_speech == PartOfSpeech.particle and token.word == "って")
         ):
             add_to_conjugated_okuri = True
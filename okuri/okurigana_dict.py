@@ -1,3 +1,4 @@
+import sys
 from typing import Optional, Union, Tuple
 
 try:
@@ -1367,6 +1368,8 @@ POSSIBLE_OKURIGANA_PROGRESSION_DICT: dict[str, dict] = {}
 
 # Populating POSSIBLE_OKURIGANA_PROGRESSION_DICT
 def add_char_dict(kana_char, char_dict, is_last):
+    # Intern the keys, so that looking up the same kana finds them by identity
+    kana_char = sys.intern(kana_char)
     if kana_char not in char_dict:
         char_dict[kana_char] = {}
     # Include a marker that this is one possible end of a okurigana
@@ -1,10 +1,18 @@
+import re
 import sys
+from functools import lru_cache
 from typing import Optional
 
 try:
-    from okuri.okurigana_dict import get_okuri_dict_for_okurigana
+    from okuri.okurigana_dict import (
+        get_okuri_dict_for_okurigana,
+        POSSIBLE_OKURIGANA_PROGRESSION_DICT,
+    )
 except ImportError:
-    from ..okuri.okurigana_dict import get_okuri_dict_for_okurigana
+    from ..okuri.okurigana_dict import (
+        get_okuri_dict_for_okurigana,
+        POSSIBLE_OKURIGANA_PROGRESSION_DICT,
+    )
 try:
     from all_types.main_types import OkuriResults, OkuriType, PartOfSpeech
 except ImportError:
@@ -15,6 +23,41 @@ except ImportError:
     from ..utils.logger import Logger
 
 
+@lru_cache(maxsize=None)
+def get_okurigana_progression_regex(
+    part_of_speech: PartOfSpeech,
+) -> tuple[re.Pattern, dict[str, bool]]:
+    """
+    Compile the okurigana progression dict of a part of speech into a regex matching the longest
+    okurigana progression at the start of a text.
+    :param part_of_speech: part of speech key of POSSIBLE_OKURIGANA_PROGRESSION_DICT.
+    :return: tuple of the compiled regex and a dict of whether each matchable okurigana is a
+        possible end of an okurigana
+    """
+    is_last_by_okurigana: dict[str, bool] = {}
+
+    def make_pattern(char_dict: dict, okurigana: str) -> str:
+        # The regex has the same nesting as the dict, each next character being optional
+        # after the previous one. As the characters on each level are distinct, the greedy
+        # match ends where the next character isn't in the dict, like walking the dict would.
+        branches = []
+        for char, next_dict in char_dict.items():
+            # Skip the is_last marker and the empty okurigana entry
+            if not char or not isinstance(next_dict, dict):
+                continue
+            is_last_by_okurigana[okurigana + char] = bool(next_dict.get("is_last"))
+            next_pattern = make_pattern(next_dict, okurigana + char)
+            escaped_char = re.escape(char)
+            branches.append(
+                f"{escaped_char}(?:{next_pattern})?" if next_pattern else escaped_char
+            )
+        return "|".join(branches)
+
+    okuri_dict = POSSIBLE_OKURIGANA_PROGRESSION_DICT[part_of_speech]
+    is_last_by_okurigana[""] = bool(okuri_dict.get("is_last"))
+    return re.compile(make_pattern(okuri_dict, "")), is_last_by_okurigana
+
+
 def starts_with_okurigana_conjugation(
     kana_text: str,
     kanji_okurigana: str,
@@ -59,32 +102,16 @@ def starts_with_okurigana_conjugation(
         logger.debug("no okurigana found and no empty string okurigana")
         return OkuriResults("", kana_text, "no_okuri", None)
 
-    okurigana = ""
-    rest = kana_text
-    prev_dict = okuri_dict
-    okuri_result: OkuriType = "no_okuri"
-    # Recurse into the dict to find the longest okurigana
-    # ending in either cur_char not being in the dict or the dict being empty
-    while True:
-        cur_char = rest[0]
-        logger.debug(
-            f"okurigana: {okurigana}, rest: {rest}, cur_char: {cur_char}, in dict:"
-            f" {cur_char in prev_dict}"
-        )
-        if cur_char not in prev_dict:
-            logger.debug(
-                f"reached dict end, empty_dict: {not prev_dict}, is_last:"
-                f" {prev_dict.get('is_last')}"
-            )
-            okuri_result = "full_okuri" if prev_dict.get("is_last") else "partial_okuri"
-            break
-        prev_dict = prev_dict[cur_char]
-        okurigana += cur_char
-        rest = rest[1:]
-        if not rest:
-            logger.debug("reached text end")
-            okuri_result = "full_okuri" if prev_dict.get("is_last") else "partial_okuri"
-            break
+    # Find the longest okurigana, ending in either the next character not being in the dict or
+    # reaching the end of the text
+    okuri_regex, is_last_by_okurigana = get_okurigana_progression_regex(part_of_speech_for_okuri)
+    okuri_match = okuri_regex.match(kana_text)
+    okurigana = okuri_match.group(0) if okuri_match else ""
+    rest = kana_text[len(okurigana) :]
+    okuri_result: OkuriType = (
+        "full_okuri" if is_last_by_okurigana[okurigana] else "partial_okuri"
+    )
+    logger.debug(f"okurigana: {okurigana}, rest: {rest}, okuri_result: {okuri_result}")
     if not okurigana and okuri_dict[""]:
         # If no okurigana was found, but this conjugation can be valid with no okurigana,
         # then we indicate that this empty string is a full okurigana
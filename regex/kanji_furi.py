@@ -8,6 +8,9 @@ KANJI_RE = r"([\d々ヶヵ\u4e00-\u9faf\u3400-\u4dbf]+)"
 KANJI_REC = re.compile(KANJI_RE)
 # Same as above but allows for being empty
 KANJI_RE_OPT = r"([\d々ヶヵ\u4e00-\u9faf\u3400-\u4dbf]*)"
+# A single kanji character only, without the other characters treated as kanji above
+KANJI_CHAR_RE = r"[\u4e00-\u9faf\u3400-\u4dbf]"
+KANJI_CHAR_REC = re.compile(KANJI_CHAR_RE)
 
 # Matching any furigana with match groups
 FURIGANA_RE = r" ?([^ >]+?)\[(.+?)\]"
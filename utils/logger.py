@@ -8,6 +8,17 @@ BLUE = "\033[34m"
 GREEN = "\033[32m"
 RESET = "\033[0m"
 
+LEVELS_BY_METHOD: dict[str, list[LogLevel]] = {
+    "error": ["error", "warning", "info", "debug"],
+    "warning": ["warning", "info", "debug"],
+    "info": ["info", "debug"],
+    "debug": ["debug"],
+}
+
+
+def _noop(message: str):
+    pass
+
 
 class Logger:
     """
@@ -15,21 +26,39 @@ class Logger:
     """
 
     def __init__(self, level: LogLevel = "info", log: Callable[[str], None] = print):
-        self.level = level
         self.log = log
+        self.level = level
+
+    @property
+    def level(self) -> LogLevel:
+        return self._level
+
+    @level.setter
+    def level(self, level: LogLevel):
+        self._level = level
+        # Replace the methods of levels that aren't logged with a no-op so that calling them
+        # doesn't check the level every time. The methods themselves then always log.
+        for method, levels in LEVELS_BY_METHOD.items():
+            if level in levels:
+                self.__dict__.pop(method, None)
+            else:
+                setattr(self, method, _noop)
+
+    def is_debug(self) -> bool:
+        """
+        Whether debug messages are logged. Use to skip building expensive debug messages, as
+        the arguments to debug are evaluated even when they aren't logged.
+        """
+        return self._level == "debug"
 
     def error(self, message: str):
-        if self.level in ["error", "warning", "info", "debug"]:
-            self.log(f"{RED}[ERROR]{RESET} {message}")
+        self.log(f"{RED}[ERROR]{RESET} {message}")
 
     def warning(self, message: str):
-        if self.level in ["warning", "info", "debug"]:
-            self.log(f"{YELLOW}[WARNING]{RESET} {message}")
+        self.log(f"{YELLOW}[WARNING]{RESET} {message}")
 
     def info(self, message: str):
-        if self.level in ["info", "debug"]:
-            self.log(f"{BLUE}[INFO]{RESET} {message}")
+        self.log(f"{BLUE}[INFO]{RESET} {message}")
 
     def debug(self, message: str):
-        if self.level == "debug":
-            self.log(f"{GREEN}[DEBUG]{RESET} {message}")
+        self.log(f"{GREEN}[DEBUG]{RESET} {message}")
@@ -0,0 +1,12 @@
+import re
+from functools import lru_cache
+
+
+@lru_cache(maxsize=1024)
+def get_compiled_regex(pattern: str) -> re.Pattern:
+    """
+    Compile a regex pattern, reusing the compiled pattern for repeated calls. Patterns built at
+    runtime, e.g. from words to highlight, can be numerous enough to get evicted from the re
+    module's own cache.
+    """
+    return re.compile(pattern)
@@ -0,0 +1,23 @@
+import os
+from functools import lru_cache
+from typing import Optional
+
+from .word_highlight import word_highlight
+
+try:
+    from utils.logger import Logger
+except ImportError:
+    from ..utils.logger import Logger  # type: ignore[no-redef]
+
+ERROR_LOGGER = Logger("error")
+DEBUG_LOGGER = Logger("debug")
+
+# Collecting debug messages for reporting failed cases slows them down and bypasses the cached
+# results, so it's only done when asked for with WH_VERBOSE_FAIL set
+VERBOSE_FAIL = bool(os.environ.get("WH_VERBOSE_FAIL"))
+
+
+# Some cases repeat the same text and word, which only need to be highlighted once
+@lru_cache(maxsize=256)
+def cached_highlight(text: Optional[str], word: Optional[str]) -> Optional[str]:
+    return word_highlight(text, word, logger=ERROR_LOGGER)
@@ -1,3 +1,5 @@
+import re
+from functools import lru_cache
 from typing import Optional
 
 try:
@@ -58,56 +60,106 @@ try:
 except ImportError:
     from ..utils.logger import Logger
 
+# Compiled once here as every call needs to scan the whole text for whitespace
+WHITESPACE_REC = re.compile(r"\s+")
+
+
+def get_word_type_for_parts_of_speech(
+    parts_of_speech: list[PartOfSpeech],
+) -> Optional[MecabWordType]:
+    """
+    Get the word type of the first verb or i-adjective part of speech in the list.
+    :param parts_of_speech: The parts of speech possible for a conjugatable last kana.
+    :return: The word type or None if there is no verb or i-adjective part of speech
+    """
+    for pos in parts_of_speech:
+        if pos.startswith("v"):
+            return "verb"
+        if pos == "adj-i":
+            return "i_adjective"
+    return None
+
+
+# Word type for each conjugatable last kana of a base form word
+ENDING_TO_WORD_TYPE: dict[str, Optional[MecabWordType]] = {
+    ending: get_word_type_for_parts_of_speech(parts_of_speech)
+    for ending, parts_of_speech in CONJUGATABLE_LAST_OKURI_PART_OF_SPEECH.items()
+}
+
+# The same words get checked on repeated calls, so cache the kana checks for them
+is_hiragana_word = lru_cache(maxsize=4096)(is_hiragana_str)
+is_katakana_word = lru_cache(maxsize=4096)(is_katakana_str)
+
+# Words whose first kana changes when inflected, e.g. する -> しない, くる -> こない
+FIRST_KANA_CHANGING_WORDS: set[str] = {"する", "くる"}
+
+
+def with_base_form_ending(word: str, base_form_word_ending: str) -> str:
+    """
+    Replace the last kana of the word with the dictionary form ending, so that token.headword
+    can match noun form verbs.
+    :param word: The word, or a katakana/hiragana form of it.
+    :param base_form_word_ending: The dictionary form ending in hiragana.
+    :return: The word with the ending, in katakana when the rest of the word is katakana
+    """
+    word_stem = word[:-1]
+    word_ending = (
+        to_katakana(base_form_word_ending) if is_katakana_word(word_stem) else base_form_word_ending
+    )
+    # The ending is usually unchanged, in which case the word is too
+    if word_ending == word[-1]:
+        return word
+    return word_stem + word_ending
+
 
 def highlight_inflected_words_with_mecab(
-    text: str, base_form_word: str, logger: Logger = Logger("error"), depth: int = 0
+    text: str,
+    base_form_word: str,
+    logger: Logger = Logger("error"),
+    parsed_tokens: Optional[dict[str, list[MecabParsedToken]]] = None,
 ) -> str:
     """
     Find inflected words in the given text using MeCab.
     :param text: The text to analyze.
+    :param base_form_word: The word to highlight, in dictionary form.
+    :param logger: Logger to use for debug messages.
+    :param parsed_tokens: MeCab tokens by parsed text, filled and reused when the same text is
+        highlighted more than once, e.g. for multiple words.
     :return: String with <b> tags around each inflected occurrence of the base form word
     """
+    if parsed_tokens is None:
+        parsed_tokens = {}
     if not text or not base_form_word:
         return text
-    if depth >= 2:
-        logger.debug(
-            f"Maximum recursion depth reached ({depth}) for text: '{text}',"
-            f" base_form_word: '{base_form_word}'"
-        )
-        return text
 
     # Determine the word type from the base form word
-    word_type: Optional[MecabWordType] = None
     base_form_word_ending = to_hiragana(base_form_word[-1])
-    possible_parts_of_speech: list[PartOfSpeech] = []
     # Check if the last character is in the conjugatable okuri list
-    if base_form_word_ending in CONJUGATABLE_LAST_OKURI_PART_OF_SPEECH:
-        possible_parts_of_speech = CONJUGATABLE_LAST_OKURI_PART_OF_SPEECH.get(base_form_word_ending)
-    elif base_form_word_ending in GODAN_FORM_VERB_STARTINGS:
+    if (
+        base_form_word_ending not in ENDING_TO_WORD_TYPE
+        and base_form_word_ending in GODAN_FORM_VERB_STARTINGS
+    ):
         # Or, if it's a godan verb in noun form, convert to dictionary form
         base_form_word_ending = GODAN_FORM_VERB_STARTINGS[base_form_word_ending]
-        possible_parts_of_speech = CONJUGATABLE_LAST_OKURI_PART_OF_SPEECH.get(base_form_word_ending)
-
-    word_stem = base_form_word[:-1]
-    # Set noun form verbs to basic verb from, so that token.headword can match them
-    if is_katakana_str(word_stem):
-        base_form_word_ending = to_katakana(base_form_word_ending)
-    base_form_word = word_stem + base_form_word_ending
-    for pos in possible_parts_of_speech:
-        if pos.startswith("v"):
-            word_type = "verb"
-            break
-        if pos == "adj-i":
-            word_type = "i_adjective"
-            break
+    word_type: Optional[MecabWordType] = ENDING_TO_WORD_TYPE.get(base_form_word_ending)
+    base_form_word = with_base_form_ending(base_form_word, base_form_word_ending)
     logger.debug(
         f"Determined word_type: '{word_type}' for base_form_word: '{base_form_word}',"
-        f" possible_parts_of_speech: {possible_parts_of_speech}"
+        f" base_form_word_ending: {base_form_word_ending}"
     )
 
+    # Parsing with MeCab is the expensive part, so skip it when the text can't contain the
+    # word at all, which is the case when the first kana of the word isn't in the text
+    word_stem = base_form_word[:-1]
+    if word_stem and to_hiragana(base_form_word) not in FIRST_KANA_CHANGING_WORDS:
+        first_kana = word_stem[0]
+        if to_hiragana(first_kana) not in text and to_katakana(first_kana) not in text:
+            logger.debug(f"First kana '{first_kana}' of word not in text, nothing to highlight")
+            return text
+
     # Store indexes of all whitespace as mecab wipes them out
     space_free_text, increment_space_indexes, restore_spaces, _ = use_text_part_storage(
-        text, part_regex=r"\s+", logger=logger
+        text, part_regex=WHITESPACE_REC, logger=logger
     )
 
     # Clean html tags from the text temporarily
@@ -119,87 +171,126 @@ def highlight_inflected_words_with_mecab(
         increment_for_b_tag_insertion(increment_space_indexes, start, end)
         increment_tag_indexes(start, end)
 
-    all_tokens: list[MecabParsedToken] = list(mecab.translate(html_and_space_free_text))
-    result = ""
-
-    found_word = False
-    opened_bold = False
-    text_char_idx = 0
-    open_bold_idx = -1
-    for token in all_tokens:
-        logger.debug(f"token.word: '{token.word}', cur result: \33[32m'{result}'\033[0m")
-        if found_word:
-            add_to_conjugated_okuri, _ = get_all_conjugation_conditions(
-                token,
-                all_tokens,
-                word_type,
-            )
-            if add_to_conjugated_okuri:
-                logger.debug(f"Continuing highlight for conjugated okuri: {token.word}")
-                result += token.word
-                text_char_idx += len(token.word)
-            else:
-                logger.debug(f"Ending highlight for conjugated okuri: {token.word}")
-                result += "</b>" + token.word
-                # We need to subtract the length of the opening tag because the text_char_idx
-                # is counting text including it
-                before_b_close_idx = text_char_idx - 3
-                text_char_idx += len(token.word) + 4
+    all_tokens = parsed_tokens.get(html_and_space_free_text)
+    if all_tokens is None:
+        all_tokens = list(mecab.translate(html_and_space_free_text))
+        parsed_tokens[html_and_space_free_text] = all_tokens
+
+    # Building the per-token debug messages is skipped unless they are logged
+    is_debug = logger.is_debug()
+
+    def highlight_word_in_tokens(word: str, word_stem: str) -> str:
+        """
+        Add <b> tags around the tokens of the word and its conjugated okuri. The indexes of the
+        stored parts are only incremented when a highlight is added.
+        :param word: The word in dictionary form, to match with token.headword.
+        :param word_stem: The word without its last kana.
+        :return: The space and tag free text with the highlights added
+        """
+        # Collect the result in parts and join them once at the end
+        result_parts: list[str] = []
+        found_word = False
+        opened_bold = False
+        text_char_idx = 0
+        open_bold_idx = -1
+        for token_index, token in enumerate(all_tokens):
+            if is_debug:
                 logger.debug(
-                    f"open_bold_idx: {open_bold_idx}, before_b_close_idx: {before_b_close_idx}"
+                    f"token.word: '{token.word}', cur result:"
+                    f" \33[32m'{''.join(result_parts)}'\033[0m"
                 )
-                increment_indexes_for_b(open_bold_idx, before_b_close_idx)
-                opened_bold = False
-                found_word = False
-        elif (
-            token.headword == base_form_word and get_word_type_from_mecab_token(token) == word_type
-        ) or token.headword == word_stem:
-            logger.debug(f"Found beginning of word to highlight: {token.word}")
-            found_word = True
-            result += "<b>" + token.word
-            open_bold_idx = text_char_idx
-            text_char_idx += len(token.word) + 3
-            opened_bold = True
-        else:
-            logger.debug(f"Not highlighting token: {token.word}")
-            result += token.word
-            text_char_idx += len(token.word)
-            found_word = False
-            # This is just safe-keeping in case of some logic error, we shouldn't really get here
-            if opened_bold:
-                logger.debug("Closing previously opened bold tag")
-                result += "</b>"
-                before_b_close_idx = text_char_idx - 3
-                text_char_idx += 4
-                logger.debug(
-                    f"open_bold_idx: {open_bold_idx}, before_b_close_idx: {before_b_close_idx}"
+            if found_word:
+                add_to_conjugated_okuri, _ = get_all_conjugation_conditions(
+                    token,
+                    all_tokens,
+                    word_type,
+                    token_index=token_index,
                 )
-                increment_indexes_for_b(open_bold_idx, before_b_close_idx)
-                opened_bold = False
-
-    if opened_bold:
-        logger.debug("Closing bold tag at end of text")
-        result += "</b>"
-        text_char_idx += 4
-
-    if "<b>" not in result:
-        # Try again with word converted to hiragana/katakana
-        logger.debug(
-            "No highlights found, retrying with base_form_word converted to hiragana/katakana."
-        )
-        if is_hiragana_str(base_form_word):
-            return highlight_inflected_words_with_mecab(
-                text, to_katakana(base_form_word), logger, depth + 1
-            )
-        elif is_katakana_str(base_form_word):
-            return highlight_inflected_words_with_mecab(
-                text, to_hiragana(base_form_word), logger, depth + 1
-            )
-        else:
-            # Mixed kana, convert to hiragana, the next recursion will convert to katakana
-            return highlight_inflected_words_with_mecab(
-                text, to_hiragana(base_form_word), logger, 0
-            )
+                if add_to_conjugated_okuri:
+                    if is_debug:
+                        logger.debug(f"Continuing highlight for conjugated okuri: {token.word}")
+                    result_parts.append(token.word)
+                    text_char_idx += len(token.word)
+                else:
+                    if is_debug:
+                        logger.debug(f"Ending highlight for conjugated okuri: {token.word}")
+                    result_parts.append("</b>")
+                    result_parts.append(token.word)
+                    # We need to subtract the length of the opening tag because the text_char_idx
+                    # is counting text including it
+                    before_b_close_idx = text_char_idx - 3
+                    text_char_idx += len(token.word) + 4
+                    if is_debug:
+                        logger.debug(
+                            f"open_bold_idx: {open_bold_idx},"
+                            f" before_b_close_idx: {before_b_close_idx}"
+                        )
+                    increment_indexes_for_b(open_bold_idx, before_b_close_idx)
+                    opened_bold = False
+                    found_word = False
+            elif (
+                token.headword == word and get_word_type_from_mecab_token(token) == word_type
+            ) or token.headword == word_stem:
+                if is_debug:
+                    logger.debug(f"Found beginning of word to highlight: {token.word}")
+                found_word = True
+                result_parts.append("<b>")
+                result_parts.append(token.word)
+                open_bold_idx = text_char_idx
+                text_char_idx += len(token.word) + 3
+                opened_bold = True
+            else:
+                if is_debug:
+                    logger.debug(f"Not highlighting token: {token.word}")
+                result_parts.append(token.word)
+                text_char_idx += len(token.word)
+                found_word = False
+                # This is just safe-keeping in case of some logic error, we shouldn't really
+                # get here
+                if opened_bold:
+                    logger.debug("Closing previously opened bold tag")
+                    result_parts.append("</b>")
+                    before_b_close_idx = text_char_idx - 3
+                    text_char_idx += 4
+                    if is_debug:
+                        logger.debug(
+                            f"open_bold_idx: {open_bold_idx},"
+                            f" before_b_close_idx: {before_b_close_idx}"
+                        )
+                    increment_indexes_for_b(open_bold_idx, before_b_close_idx)
+                    opened_bold = False
+
+        if opened_bold:
+            logger.debug("Closing bold tag at end of text")
+            result_parts.append("</b>")
+            text_char_idx += 4
+
+        return "".join(result_parts)
+
+    # MeCab doesn't give the same headword for the hiragana and katakana forms of a word, so
+    # when the word isn't found as is, try it converted to katakana/hiragana against the same
+    # tokens instead of parsing the text again
+    if is_hiragana_word(base_form_word):
+        word_forms = [base_form_word, to_katakana(base_form_word)]
+    elif is_katakana_word(base_form_word):
+        word_forms = [base_form_word, to_hiragana(base_form_word)]
+    else:
+        # Mixed kana, try both
+        word_forms = [base_form_word, to_hiragana(base_form_word), to_katakana(base_form_word)]
+
+    for word_form in word_forms:
+        # The kana conversion can change the ending of a word with kanji in it
+        word_form = with_base_form_ending(word_form, base_form_word_ending)
+        word_stem = word_form[:-1]
+        logger.debug(f"Highlighting word form '{word_form}'")
+        word_result = highlight_word_in_tokens(word_form, word_stem)
+        if "<b>" in word_result:
+            result = word_result
+            break
+        logger.debug("No highlights found for word form")
+    else:
+        # Nothing to highlight, the text is returned as is
+        return text
     logger.debug(f"Final highlighted result before restoring tags/spaces: '{result}'")
 
     # Restore removed parts in reverse order
@@ -0,0 +1,32 @@
+import pytest
+
+from ._test_support import ERROR_LOGGER
+from .word_highlight import word_highlight, word_highlight_many
+from .word_highlight_tests import CASES
+
+# The word_highlight_tests cases as pytest parameters named by their test names, so that they can
+# be run in parallel with pytest-xdist, e.g. pytest -n auto word/test_word_highlight.py
+PARAMS = [
+    pytest.param(
+        case["text"],
+        case["word"],
+        case.get("expected"),
+        id=case["test_name"],
+        marks=pytest.mark.xfail(strict=False) if case.get("ignore_fail") else (),
+    )
+    for case in CASES
+]
+
+
+@pytest.mark.parametrize("text,word,expected", PARAMS)
+def test_word_highlight(text: str, word: str, expected: str):
+    assert word_highlight(text, word, logger=ERROR_LOGGER) == expected
+
+
+def test_word_highlight_many():
+    text = "こんな 見[み]たら 観客[かんきゃく] 座[すわ]ってるのに 総[そう]勃ち だよ"
+    # Kana only words matched as is and through MeCab, and kanji words with and without okurigana
+    words = ["こんな", "みる", "観客[かんきゃく]", "座[すわ]る", "見[み]る"]
+    assert word_highlight_many(text, words, ERROR_LOGGER) == [
+        word_highlight(text, word, logger=ERROR_LOGGER) for word in words
+    ]
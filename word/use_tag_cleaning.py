@@ -20,6 +20,12 @@ try:
 except ImportError:
     from ..utils.logger import Logger
 
+HTML_TAG_REC = re.compile(r"<\/?[^>]+>")
+# An opening tag before opening <b>, but it's closing tag is before the b closing tag
+TAG_BEFORE_B_OPEN_REC = re.compile(r"(<([^>]+)>)(<b>)([^<]*</\2>)")
+# An opening tag before closing </b>, but it's closing tag is after the </b>
+TAG_BEFORE_B_CLOSE_REC = re.compile(r"(<([^>]+)>[^<]*)(</b>)(<\/\2>)")
+
 
 def increment_for_b_tag_insertion(
     increment_tag_indexes: IndexIncrementer,
@@ -59,10 +65,11 @@ def apply_tag_fixes(restored_text: str) -> str:
         The text after applying fixes.
     """
     result = restored_text
-    # An opening tag before opening <b>, but it's closing tag is before the b closing tag
-    result = re.sub(r"(<([^>]+)>)(<b>)([^<]*</\2>)", r"\3\1\4", result)
-    # An opening tag before closing </b>, but it's closing tag is after the </b>
-    result = re.sub(r"(<([^>]+)>[^<]*)(</b>)(<\/\2>)", r"\1\4\3", result)
+    # Each fix can only apply if the text has the b tag it moves
+    if "<b>" in result:
+        result = TAG_BEFORE_B_OPEN_REC.sub(r"\3\1\4", result)
+    if "</b>" in result:
+        result = TAG_BEFORE_B_CLOSE_REC.sub(r"\1\4\3", result)
     return result
 
 
@@ -85,7 +92,7 @@ def use_tag_cleaning_with_b_insertion(
             - The indexes of the stored tags.
     """
     cleaned_text, increment_indexes, restore_parts, indexes = use_text_part_storage(
-        text, part_regex=r"<\/?[^>]+>", logger=logger
+        text, part_regex=HTML_TAG_REC, logger=logger
     )
 
     def custom_incrementer(
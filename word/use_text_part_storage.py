@@ -1,10 +1,15 @@
 import re
+from bisect import bisect_left, bisect_right
 from typing import Callable
 
 try:
     from utils.logger import Logger
 except ImportError:
     from ..utils.logger import Logger
+try:
+    from utils.regex_cache import get_compiled_regex
+except ImportError:
+    from ..utils.regex_cache import get_compiled_regex
 
 TextPartIndexes = list[tuple[int, int, str]]
 OffsetIndexes = list[tuple[int, int]]
@@ -31,29 +36,44 @@ def make_diff_string_for_indexes(
         characters.
     """
     # Simulate the state of the edits made to the cleaned_text by adding _ characters for each
-    # offset
-    simulated_edited_text = cleaned_text
-    total_offset = 0
+    # offset. The offsets are sorted, so the text can be built in a single pass.
     logger.debug(f"Offset indexes: {offset_indexes}")
+    simulated_text_parts: list[str] = []
+    cleaned_index = 0
     for index, offset in sorted(offset_indexes, key=lambda x: x[0]):
-        adjusted_index = index + total_offset
-        simulated_edited_text = (
-            simulated_edited_text[:adjusted_index]
-            + ("_" * offset)
-            + simulated_edited_text[adjusted_index:]
-        )
-        total_offset += offset
+        simulated_text_parts.append(cleaned_text[cleaned_index:index])
+        simulated_text_parts.append("_" * offset)
+        cleaned_index = max(cleaned_index, index)
+    simulated_text_parts.append(cleaned_text[cleaned_index:])
+    simulated_edited_text = "".join(simulated_text_parts)
     logger.debug(f"Simulated edited text: \33[90m'{simulated_edited_text}'\33[0m")
     # Then reconstruct the parts into the simulated edited text exactly as restore_parts
+    simulated_text_parts = []
+    simulated_index = 0
+    restored_length = 0
     for start, end, part_str in indexes:
-        simulated_edited_text = (
-            simulated_edited_text[:start] + part_str + simulated_edited_text[start:]
-        )
-    return simulated_edited_text
+        insert_index = start - restored_length
+        simulated_text_parts.append(simulated_edited_text[simulated_index:insert_index])
+        simulated_text_parts.append(part_str)
+        simulated_index = insert_index
+        restored_length += len(part_str)
+    simulated_text_parts.append(simulated_edited_text[simulated_index:])
+    return "".join(simulated_text_parts)
+
+
+def increment_no_indexes(after_part_free_index: int, offset: int, strict: bool = False) -> None:
+    """Index incrementer for text without any stored parts, there's nothing to increment."""
+
+
+def restore_no_parts(edited_text: str) -> str:
+    """Restorer for text without any stored parts, returns the text as is."""
+    return edited_text
 
 
 def use_text_part_storage(
-    text: str, part_regex: str = r"<\/?[^>]+>", logger: Logger = Logger("error")
+    text: str,
+    part_regex: str | re.Pattern = r"<\/?[^>]+>",
+    logger: Logger = Logger("error"),
 ) -> tuple[str, IndexIncrementer, TextPartRestorer, TextPartIndexes]:
     """
     Stores indexes of all parts matching the given regex and removes them temporarily, to
@@ -61,6 +81,7 @@ def use_text_part_storage(
     Args:
         text: The original text containing parts to be stored.
         part_regex: The regex pattern to identify parts to be stored. Defaults to HTML tags.
+            Can also be an already compiled pattern.
         logger: Logger instance for logging debug and error messages.
     Returns:
         A tuple containing:
@@ -69,45 +90,72 @@ def use_text_part_storage(
             - A function to restore the stored parts back into the text.
     """
 
+    part_rec = part_regex if isinstance(part_regex, re.Pattern) else get_compiled_regex(part_regex)
+    first_match = part_rec.search(text)
+    if first_match is None:
+        # Nothing to store, so skip setting up the storage
+        logger.debug(f"No parts matching regex: '{part_rec.pattern}' found in text.")
+        return text, increment_no_indexes, restore_no_parts, []
+
     part_indexes: TextPartIndexes = []
+    # Starts of part_indexes kept in a separate list, so they can be bisected
+    part_starts: list[int] = []
+    # Starts of part_indexes minus the lengths of the parts before them, i.e. where each part
+    # would start in the text without parts, and the total length of the parts before each
+    # part, so the original index of a part free index can be found with a bisect
+    part_free_starts: list[int] = []
+    part_length_sums: list[int] = [0]
     offset_indexes: OffsetIndexes = []
+    # Running maximum of the indexes and running sum of the offsets in offset_indexes, so the
+    # offsets added before a given index can be summed with a bisect
+    offset_index_maxima: list[int] = []
+    offset_sums: list[int] = []
     last_index = 0
 
+    part_regex = part_rec.pattern
     logger.debug(f"Using part regex: '{part_regex}' to store text parts.")
+    # Building the debug messages is skipped unless they are logged, as the functions returned
+    # are called repeatedly and the diff string rebuilds the whole text
+    is_debug = logger.is_debug()
 
-    cleaned_text = ""
-    for match in re.finditer(part_regex, text):
+    # Collect the text between the parts and join them once at the end
+    cleaned_text_parts: list[str] = []
+    # Continue from the first match instead of searching the text before it again
+    for match in part_rec.finditer(text, first_match.start()):
         start, end = match.span()
-        cleaned_text += text[last_index:start]
+        cleaned_text_parts.append(text[last_index:start])
         part_indexes.append((start, end, match.group(0)))
-        logger.debug(f"Found part matching regex: '{match.group(0)}' at indexes ({start}, {end})")
+        part_starts.append(start)
+        part_free_starts.append(start - part_length_sums[-1])
+        part_length_sums.append(part_length_sums[-1] + end - start)
+        if is_debug:
+            logger.debug(
+                f"Found part matching regex: '{match.group(0)}' at indexes ({start}, {end})"
+            )
         last_index = end
-    cleaned_text += text[last_index:]
+    cleaned_text_parts.append(text[last_index:])
+    cleaned_text = "".join(cleaned_text_parts)
     logger.debug(f"Text after removal of parts: '{cleaned_text}'")
     logger.debug(f"Indexes of removed parts stored: {part_indexes}")
 
     def part_free_to_original_index(part_free_index: int) -> int:
         """Convert index in text after removal to index in original text."""
-        logger.debug(f"Converting part_free_index: {part_free_index} to original index")
-        # Calculate offset due to removed parts
-        parts_offset = 0
-        for start, end, _ in part_indexes:
-            if start <= part_free_index + parts_offset:
-                parts_offset += end - start
-            else:
-                break
-        logger.debug(f"original_index with parts_offset: {part_free_index + parts_offset}")
-        # Now account for any offsets added during modifications
-        offsets_offset = 0
-        for index, offset in offset_indexes:
-            if index <= part_free_index:
-                offsets_offset += offset
-            else:
-                break
-        logger.debug(
-            "final original_index with offsets_offset:"
-            f" {part_free_index + parts_offset - offsets_offset}"
-        )
+        if is_debug:
+            logger.debug(f"Converting part_free_index: {part_free_index} to original index")
+        # Calculate offset due to removed parts, which is the length of all parts starting at
+        # or before the index
+        parts_offset = part_length_sums[bisect_right(part_free_starts, part_free_index)]
+        if is_debug:
+            logger.debug(f"original_index with parts_offset: {part_free_index + parts_offset}")
+        # Now account for any offsets added during modifications, summing the offsets until the
+        # first one recorded at an index after part_free_index
+        offsets_count = bisect_right(offset_index_maxima, part_free_index)
+        offsets_offset = offset_sums[offsets_count - 1] if offsets_count else 0
+        if is_debug:
+            logger.debug(
+                "final original_index with offsets_offset:"
+                f" {part_free_index + parts_offset - offsets_offset}"
+            )
 
         return part_free_index + parts_offset - offsets_offset
 
@@ -125,43 +173,75 @@ def use_text_part_storage(
         # Find the first part at or after the calculated position
         # We want to include parts that are right at the boundary
         actual_after_index = after_original_index
-        for start, end, _ in part_indexes:
-            if start < after_original_index and end > after_original_index:
+        # As the parts don't overlap, only the last part starting before the position can span
+        # across or end at it
+        before_index = bisect_left(part_starts, after_original_index) - 1
+        if before_index >= 0:
+            start, end, _ = part_indexes[before_index]
+            if end > after_original_index:
                 # Part spans across the insertion point, start from this tag
                 actual_after_index = start
-                break
             elif end == after_original_index and not strict:
                 # Part ends exactly at insertion point, include it
                 actual_after_index = start
-                break
 
-        logger.debug(
-            "increment_indexes:"
-            f" after_original={after_original_index} (actual={actual_after_index}),"
-            f" offset={offset}"
-        )
+        if is_debug:
+            logger.debug(
+                "increment_indexes:"
+                f" after_original={after_original_index} (actual={actual_after_index}),"
+                f" offset={offset}"
+            )
 
-        for i in range(len(part_indexes)):
-            start, end, tag_str = part_indexes[i]
-            if start >= actual_after_index:
-                part_indexes[i] = (start + offset, end + offset, tag_str)
-                logger.debug(f"  Incremented part at {start} to {start + offset}")
+        # Parts are sorted by start and all get shifted by the same offset, so they stay sorted
+        # and only the tail starting from the first part at or after actual_after_index changes
+        first_shifted = bisect_left(part_starts, actual_after_index)
+        # Shift the whole tail with slice assignments, which keeps part_indexes the same list
+        # object that was returned to the caller
+        part_indexes[first_shifted:] = [
+            (start + offset, end + offset, part_str)
+            for start, end, part_str in part_indexes[first_shifted:]
+        ]
+        part_starts[first_shifted:] = [start + offset for start in part_starts[first_shifted:]]
+        part_free_starts[first_shifted:] = [
+            start + offset for start in part_free_starts[first_shifted:]
+        ]
+        if is_debug:
+            logger.debug(f"  Incremented {len(part_indexes) - first_shifted} parts by {offset}")
 
         # Record the offset for future index calculations
         offset_indexes.append((after_part_free_index, offset))
+        if offset_index_maxima:
+            offset_index_maxima.append(max(offset_index_maxima[-1], after_part_free_index))
+            offset_sums.append(offset_sums[-1] + offset)
+        else:
+            offset_index_maxima.append(after_part_free_index)
+            offset_sums.append(offset)
 
-        logger.debug(
-            f"Diff state after increment_indexes - part regex: {part_regex}\n"
-            f"\33[90m'{make_diff_string_for_indexes(cleaned_text, part_indexes, offset_indexes, logger)}'\033[0m"
-        )
+        if is_debug:
+            logger.debug(
+                f"Diff state after increment_indexes - part regex: {part_regex}\n"
+                f"\33[90m'{make_diff_string_for_indexes(cleaned_text, part_indexes, offset_indexes, logger)}'\033[0m"
+            )
 
     def restore_parts(edited_text: str) -> str:
         """Restores the parts back into the text."""
+        # The part starts are indexes in the restored text, so the index in edited_text is
+        # the start minus the length of the parts restored before it. The parts are sorted,
+        # so the text can be rebuilt in a single pass.
+        restored_text_parts: list[str] = []
+        edited_index = 0
+        restored_length = 0
         for start, end, part_str in part_indexes:
-            edited_text = edited_text[:start] + part_str + edited_text[start:]
-            logger.debug(f"Restored part: '{part_str}' at index {start}")
+            insert_index = start - restored_length
+            restored_text_parts.append(edited_text[edited_index:insert_index])
+            restored_text_parts.append(part_str)
+            edited_index = insert_index
+            restored_length += len(part_str)
+            if is_debug:
+                logger.debug(f"Restored part: '{part_str}' at index {start}")
+        restored_text_parts.append(edited_text[edited_index:])
 
-        return edited_text
+        return "".join(restored_text_parts)
 
     return cleaned_text, increment_indexes, restore_parts, part_indexes
 
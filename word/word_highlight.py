@@ -1,13 +1,19 @@
 import re
+from functools import lru_cache
+from typing import Callable, Optional
 
+try:
+    from mecab_controller.basic_types import MecabParsedToken
+except ImportError:
+    from ..mecab_controller.basic_types import MecabParsedToken
 try:
     from kana.reading_matcher import check_reading_match
 except ImportError:
     from ..kana.reading_matcher import check_reading_match
 try:
-    from all_types.main_types import OkuriResults
+    from all_types.main_types import OkuriResults, ReadingType
 except ImportError:
-    from ..all_types.main_types import OkuriResults
+    from ..all_types.main_types import OkuriResults, ReadingType
 
 try:
     from highlight_inflected_words_with_mecab import highlight_inflected_words_with_mecab
@@ -35,42 +41,80 @@ try:
     from utils.logger import Logger
 except ImportError:
     from ..utils.logger import Logger
+try:
+    from utils.regex_cache import get_compiled_regex
+except ImportError:
+    from ..utils.regex_cache import get_compiled_regex
+try:
+    from regex.kanji_furi import KANJI_CHAR_REC
+except ImportError:
+    from ..regex.kanji_furi import KANJI_CHAR_REC
 
 KANJI_AND_MAYBE_FURIGANA_AND_OKURIGANA_RE = (
     r"([\d々\u4e00-\u9faf\u3400-\u4dbfヶヵ]+)(?:\[([^\]]*?)\])?([ぁ-ん]*)$"
 )
+KANJI_AND_MAYBE_FURIGANA_AND_OKURIGANA_REC = re.compile(KANJI_AND_MAYBE_FURIGANA_AND_OKURIGANA_RE)
 LAST_KANJI_FURIGANA_RE = r"([\u4e00-\u9faf\u3400-\u4dbfヶヵ])(々?)(?:\[([^\]]*?)\])?$"
+LAST_KANJI_FURIGANA_REC = re.compile(LAST_KANJI_FURIGANA_RE)
 
 CONSECUTIVE_FURI_WORD_RE = (
     r"(?: ([\d々\u4e00-\u9faf\u3400-\u4dbfヶヵ]+)\[([^\]]*?)\])(?:"
     r" ([\d々\u4e00-\u9faf\u3400-\u4dbfヶヵ]+)\[([^\]]*?)\])"
 )
+CONSECUTIVE_FURI_WORD_REC = re.compile(CONSECUTIVE_FURI_WORD_RE)
+
+# Reading type tags added by kana_highlight when splitting furigana
+READING_TYPE_TAG_REC = re.compile(r"</?(?:on|kun|juk|mix|oku)>")
+# Katakana at the end of a word after furigana and optional hiragana okuri
+KATAKANA_SUFFIX_AFTER_FURI_REC = re.compile(r"(\[[^\]]*?\])([ぁ-ん]*)([ァ-ン]+)$")
 
 
+# The same words get highlighted repeatedly, so cache the kana check for them
+is_kana_word = lru_cache(maxsize=4096)(is_kana_str)
+
+# Translation table replacing each hiragana character in [ぁ-ん] with a katakana or hiragana
+# option
+HIRAGANA_TO_KANA_OPTION_PATTERN = {
+    code_point: f"(?:{chr(code_point)}|{to_katakana(chr(code_point))})"
+    for code_point in range(ord("ぁ"), ord("ん") + 1)
+}
+# Any katakana that a hiragana option of the word patterns could match
+KATAKANA_CHAR_OPTION_REC = re.compile(r"[ァ-ヺ]")
+# Translation table converting katakana ァ-ヶ to hiragana, for the kana matched after a word
+# and the fixed katakana suffix of a word, which the patterns limit to [ぁ-んア-ン] and [ァ-ン]
+KATAKANA_TO_HIRAGANA = {code_point: code_point - 0x60 for code_point in range(0x30A1, 0x30F7)}
+
+
+@lru_cache(maxsize=4096)
 def replace_hiragana_in_pattern(text: str) -> str:
     # Replace each hiragana character with a katanana or hiragana option
-    def replace_hiragana(match: re.Match) -> str:
-        char = match.group(0)
-        katakana_char = to_katakana(char)
-        return rf"(?:{char}|{katakana_char})"
-
-    return re.sub(r"[ぁ-ん]", replace_hiragana, text)
+    return text.translate(HIRAGANA_TO_KANA_OPTION_PATTERN)
 
 
+@lru_cache(maxsize=4096)
 def make_word_pattern(word: str) -> str:
     # Remove first space
-    word = re.sub(r"^ ", "", word)
+    word = word.removeprefix(" ")
     # Escape the word for regex special characters
     escaped_word = re.escape(word)
     escaped_word = replace_hiragana_in_pattern(escaped_word)
     return rf"\s?{escaped_word}"
 
 
+@lru_cache(maxsize=4096)
+def get_word_regex(word: str) -> re.Pattern:
+    """Compiles the make_word_pattern pattern of a word, for matching the word as is."""
+    return re.compile(make_word_pattern(word))
+
+
 def preserve_small_counter_kana(text: str) -> str:
     # Keep Japanese counter kana in katakana form after to_hiragana conversion.
     return text.replace("ゕ", "ヵ").replace("ゖ", "ヶ")
 
 
+# Splitting runs kana_highlight which is expensive, while the same words and texts are often
+# highlighted repeatedly
+@lru_cache(maxsize=4096)
 def split_furi_text_into_individual_kanji_furigana(furi_text: str) -> str:
     """Splits a furigana text into individual kanji-furigana parts with kana_highlight.
 
@@ -92,10 +136,52 @@ def split_furi_text_into_individual_kanji_furigana(furi_text: str) -> str:
         ),
     )
     # Replace tags so that we now have all kanji furigana split except for repeaters
-    furi_text = re.sub(r"</?(?:on|kun|juk|mix|oku)>", "", furi_text)
+    furi_text = READING_TYPE_TAG_REC.sub("", furi_text)
     return furi_text
 
 
+# MeCab is the expensive part of checking for inflections while the same okuri get checked
+# repeatedly, so the results are cached. The cached functions don't log, so calls with a
+# debugging logger bypass the caches.
+@lru_cache(maxsize=8192)
+def get_cached_word_conjugated_okuri(
+    word: str, reading: str, maybe_okuri: str
+) -> tuple[OkuriResults, bool]:
+    return get_conjugated_okuri_with_mecab(
+        word=word, reading=reading, maybe_okuri=maybe_okuri, okuri_prefix="word"
+    )
+
+
+@lru_cache(maxsize=8192)
+def get_cached_reading_match(
+    reading: str, mora_string: str, okurigana: str
+) -> tuple[str, ReadingType]:
+    return check_reading_match(reading=reading, mora_string=mora_string, okurigana=okurigana)
+
+
+def get_word_conjugated_okuri(
+    word: str, reading: str, maybe_okuri: str, logger: Logger
+) -> tuple[OkuriResults, bool]:
+    """get_conjugated_okuri_with_mecab with the okuri attached to the word, cached unless
+    debugging."""
+    if logger.is_debug():
+        return get_conjugated_okuri_with_mecab(
+            word=word, reading=reading, maybe_okuri=maybe_okuri, okuri_prefix="word", logger=logger
+        )
+    return get_cached_word_conjugated_okuri(word, reading, maybe_okuri)
+
+
+def get_reading_match(
+    reading: str, mora_string: str, okurigana: str, logger: Logger
+) -> tuple[str, ReadingType]:
+    """check_reading_match, cached unless debugging."""
+    if logger.is_debug():
+        return check_reading_match(
+            reading=reading, mora_string=mora_string, okurigana=okurigana, logger=logger
+        )
+    return get_cached_reading_match(reading, mora_string, okurigana)
+
+
 def merge_consecutive_furigana(split_furi_text: str) -> str:
     """Merges consecutive kanji-furigana parts back into a single furigana text.
 
@@ -104,22 +190,98 @@ def merge_consecutive_furigana(split_furi_text: str) -> str:
     Returns:
         str: The merged furigana text.
     """
-    pattern = re.compile(CONSECUTIVE_FURI_WORD_RE)
-    while match := pattern.search(split_furi_text):
-        first_kanji = match.group(1)
-        first_furi = match.group(2)
-        second_kanji = match.group(3)
-        second_furi = match.group(4)
-        merged_kanji = first_kanji + second_kanji
-        merged_furi = first_furi + second_furi
-        merged_text = f" {merged_kanji}[{merged_furi}]"
-        split_furi_text = (
-            split_furi_text[: match.start(0)] + merged_text + split_furi_text[match.end(0) :]
+    def merge_furigana(match: re.Match) -> str:
+        first_kanji, first_furi, second_kanji, second_furi = match.groups()
+        return f" {first_kanji}{second_kanji}[{first_furi}{second_furi}]"
+
+    # Each pass merges non-overlapping pairs, so repeat until there is nothing left to merge
+    # in case more than two parts were consecutive
+    merge_count = 1
+    while merge_count:
+        split_furi_text, merge_count = CONSECUTIVE_FURI_WORD_REC.subn(
+            merge_furigana, split_furi_text
         )
     return split_furi_text
 
 
-def word_highlight(text: str, word: str, logger: Logger) -> str:
+def remove_leading_space(text: str) -> str:
+    """Removes the space at the beginning of the text, also when it's right after a <b> tag."""
+    if text.startswith("<b> "):
+        return "<b>" + text[4:]
+    if text.startswith(" "):
+        return text[1:]
+    return text
+
+
+def highlight_kana_word_literally(text: str, word: str) -> Optional[str]:
+    """Wraps the occurrences of a kana word in <b> tags with str.find, giving the same result as
+    substituting with the get_word_regex pattern but without running its per character
+    alternation.
+
+    Args:
+        text (str): The text to highlight the word in.
+        word (str): The kana word to highlight.
+    Returns:
+        Optional[str]: The highlighted text, or None when the text has katakana or the word has
+        whitespace so that the regex needs to be used.
+    """
+    if any(char.isspace() for char in word) or KATAKANA_CHAR_OPTION_REC.search(text):
+        return None
+    result_parts: list[str] = []
+    text_index = 0
+    word_index = text.find(word)
+    while word_index != -1:
+        # Like the \s? of the pattern, include a whitespace before the word in the match
+        start = word_index
+        if start > text_index and text[start - 1].isspace():
+            start -= 1
+        end = word_index + len(word)
+        result_parts.append(text[text_index:start])
+        result_parts.append("<b>")
+        result_parts.append(text[start:end])
+        result_parts.append("</b>")
+        text_index = end
+        word_index = text.find(word, end)
+    result_parts.append(text[text_index:])
+    return "".join(result_parts)
+
+
+def insert_b_tags(
+    text: str,
+    b_indices: list[tuple[int, int]],
+    increment_tag_indexes: Callable[[int, int], None],
+) -> str:
+    """Wraps the given index ranges of the text in <b> tags.
+
+    Args:
+        text (str): The text to insert the tags into.
+        b_indices (list[tuple[int, int]]): Sorted, non-overlapping start and end indices in the
+            text to wrap.
+        increment_tag_indexes (Callable[[int, int], None]): Incrementer of the stored tag indexes,
+            called with the indices of each range in the text with the previous <b> tags added.
+    Returns:
+        str: The text with the <b> tags inserted.
+    """
+    result_parts: list[str] = []
+    text_index = 0
+    for idx, (start, end) in enumerate(b_indices):
+        # Each previous range has added 7 characters for <b></b> before this one
+        increment_tag_indexes(start + 7 * idx, end + 7 * idx)
+        result_parts.append(text[text_index:start])
+        result_parts.append("<b>")
+        result_parts.append(text[start:end])
+        result_parts.append("</b>")
+        text_index = end
+    result_parts.append(text[text_index:])
+    return "".join(result_parts)
+
+
+def word_highlight(
+    text: str,
+    word: str,
+    logger: Logger,
+    parsed_tokens: Optional[dict[str, list[MecabParsedToken]]] = None,
+) -> str:
     """
     Takes a japanese word or phrase in dictionary form and finds any inflected occurrences of
     it in the given text. The word and text is expected to be in furigana syntax; with brackets
@@ -152,6 +314,8 @@ def word_highlight(text: str, word: str, logger: Logger) -> str:
     Args:
         text (str): The input text where the word needs to be highlighted.
         word (str): The word to highlight.
+        parsed_tokens (dict[str, list[MecabParsedToken]], optional): MeCab tokens by parsed
+            text, shared between calls highlighting kana only words in the same text.
 
     Returns:
         list[tuple[int,int]]: A list of tuples containing the start and end indices of the
@@ -160,32 +324,41 @@ def word_highlight(text: str, word: str, logger: Logger) -> str:
     logger.debug(f"word_highlight: text='{text}', word='{word}'")
     if not text or not word or not word.strip():
         return text
+    # Building the per-match debug messages is skipped unless they are logged
+    is_debug = logger.is_debug()
 
-    if is_kana_str(word):
+    if is_kana_word(word):
         logger.debug("Word is kana only, use highlight_inflected_words_with_mecab")
         # This is either a simple case or a complex one needing inflection matching
-        # First try a simple regex match
-        pattern = make_word_pattern(word)
-        logger.debug(f"Using pattern: {pattern}")
+        # First try a simple match, finding the word as is when the text has no katakana that
+        # the hiragana in the word could also match
+        result = highlight_kana_word_literally(text, word)
+        if result is None:
+            word_rec = get_word_regex(word)
+            logger.debug(f"Using pattern: {word_rec.pattern}")
 
-        def replace_match(match: re.Match) -> str:
-            return f"<b>{match.group(0)}</b>"
+            def replace_match(match: re.Match) -> str:
+                return f"<b>{match.group(0)}</b>"
 
-        result = re.sub(pattern, replace_match, text)
+            result = word_rec.sub(replace_match, text)
 
         if result != text:
             # If that worked, return the result
             return result
 
         # Otherwise, use MeCab to find inflected forms
-        return highlight_inflected_words_with_mecab(text, word, logger=logger)
+        return highlight_inflected_words_with_mecab(
+            text, word, logger=logger, parsed_tokens=parsed_tokens
+        )
 
     # Strip trailing katakana suffix after furigana (with optional hiragana okuri)
     # before to_hiragana so it is not mistaken for inflectable okurigana.
-    katakana_suffix_after_furi_match = re.search(r"(\[[^\]]*?\])([ぁ-ん]*)([ァ-ン]+)$", word)
+    katakana_suffix_after_furi_match = KATAKANA_SUFFIX_AFTER_FURI_REC.search(word)
     katakana_fixed_suffix = (
         katakana_suffix_after_furi_match.group(3) if katakana_suffix_after_furi_match else ""
     )
+    # The suffix is only [ァ-ン] katakana, so the translate table converts it like to_hiragana
+    hiragana_fixed_suffix = katakana_fixed_suffix.translate(KATAKANA_TO_HIRAGANA)
     if katakana_fixed_suffix:
         word = word[: -len(katakana_fixed_suffix)]
         logger.debug(
@@ -199,8 +372,9 @@ def word_highlight(text: str, word: str, logger: Logger) -> str:
 
     # We have some kanji in the word to match
     # First, remove kana from the end of the word, to see if there is any okurigana
-    word_match = re.search(KANJI_AND_MAYBE_FURIGANA_AND_OKURIGANA_RE, word)
-    logger.debug(f"word_match groups: {word_match.groups() if word_match else None}")
+    word_match = KANJI_AND_MAYBE_FURIGANA_AND_OKURIGANA_REC.search(word)
+    if is_debug:
+        logger.debug(f"word_match groups: {word_match.groups() if word_match else None}")
     ending_okurigana = word_match.group(3) if word_match else ""
     word_without_furigana = word_match.group(1) if word_match else word[: -len(ending_okurigana)]
     furigana = word_match.group(2) if word_match else ""
@@ -209,10 +383,18 @@ def word_highlight(text: str, word: str, logger: Logger) -> str:
         f" ending_okurigana: '{ending_okurigana}'"
     )
 
+    # Every match includes the word's kanji as is, so when one of them isn't in the text, there
+    # is nothing to highlight and the tag cleaning, splitting and MeCab work can be skipped.
+    # Numbers, 々 and the counter kana are skipped as the text may write them differently.
+    # The text is returned unchanged, as in all the other cases where nothing matches.
+    if any(kanji not in text for kanji in KANJI_CHAR_REC.findall(word_without_furigana)):
+        logger.debug("A kanji of the word is not in the text, nothing to highlight")
+        return text
+
     if not ending_okurigana and not furigana:
         logger.debug("No ending kana and no furigana but have kanji -> simple regex match")
         # Most simple case, we can regex search for the word directly
-        pattern = make_word_pattern(word)
+        word_rec = get_word_regex(word)
 
         # Remove tags from text temporarily
         html_free_text, increment_tag_indexes, restore_tags, _ = use_tag_cleaning_with_b_insertion(
@@ -223,7 +405,7 @@ def word_highlight(text: str, word: str, logger: Logger) -> str:
             increment_tag_indexes(match.start(0), match.end(0))
             return f"<b>{match.group(0)}</b>"
 
-        result = re.sub(pattern, replace_match, html_free_text)
+        result = word_rec.sub(replace_match, html_free_text)
         logger.debug(f"Intermediate result with <b> tags: '{result}'")
         result = restore_tags(result)
         return result
@@ -244,9 +426,7 @@ def word_highlight(text: str, word: str, logger: Logger) -> str:
         pattern = make_word_pattern(word_with_readings_split)
         if katakana_fixed_suffix:
             # Append the fixed katakana suffix to the pattern, matching both katakana and hiragana.
-            katakana_suffix_pattern = replace_hiragana_in_pattern(
-                to_hiragana(katakana_fixed_suffix)
-            )
+            katakana_suffix_pattern = replace_hiragana_in_pattern(hiragana_fixed_suffix)
             pattern += katakana_suffix_pattern
             logger.debug(f"Appended fixed katakana suffix pattern: '{katakana_suffix_pattern}'")
         logger.debug(f"Using pattern: {pattern}")
@@ -261,7 +441,12 @@ def word_highlight(text: str, word: str, logger: Logger) -> str:
             increment_tag_indexes(match.start(0), match.end(0))
             return f"<b>{match.group(0)}</b>"
 
-        result = re.sub(pattern, replace_match, html_free_text)
+        result, match_count = get_compiled_regex(pattern).subn(replace_match, html_free_text)
+        if not match_count:
+            # Like when the word's kanji aren't in the text, return the text without the
+            # furigana splitting and merging changing it
+            logger.debug("No matches found, nothing to highlight")
+            return text
         logger.debug(f"Intermediate result with <b> tags: '{result}'")
 
         # Restore tags now, as the tag indexes are based on the split text
@@ -272,7 +457,7 @@ def word_highlight(text: str, word: str, logger: Logger) -> str:
         result = merge_consecutive_furigana(result)
 
         # Remove space from beginning as it's not required
-        result = re.sub(r"^(<b>)? ", r"\1", result)
+        result = remove_leading_space(result)
         return result
 
     # Getting more complicated, need to handle possible inflections
@@ -292,32 +477,33 @@ def word_highlight(text: str, word: str, logger: Logger) -> str:
             text, logger=logger
         )
         logger.debug(f"html_free_text for matching: '{html_free_text}'")
-        matches = re.finditer(pattern, html_free_text)
+        matches = get_compiled_regex(pattern).finditer(html_free_text)
         result_indices: list[tuple[int, int]] = []
         for m in matches:
             maybe_okuri = m.group(1)
-            logger.debug(
-                f"Found potential match at indices ({m.start(0)}, {m.end(0)}),"
-                f" maybe_okuri: '{maybe_okuri}'"
-            )
+            if is_debug:
+                logger.debug(
+                    f"Found potential match at indices ({m.start(0)}, {m.end(0)}),"
+                    f" maybe_okuri: '{maybe_okuri}'"
+                )
             if maybe_okuri == ending_okurigana:
                 # Exact match, no need to check inflection
                 logger.debug("Exact match found, no inflection check needed")
                 result_indices.append((m.start(0), m.end(0)))
                 continue
             # Check if the maybe_okuri contains a valid inflection for the ending_okurigana
-            okuri_result, _ = get_conjugated_okuri_with_mecab(
+            okuri_result, _ = get_word_conjugated_okuri(
                 word=word_without_furigana,
                 reading=furigana,
-                maybe_okuri=to_hiragana(maybe_okuri),
-                okuri_prefix="word",
+                maybe_okuri=maybe_okuri.translate(KATAKANA_TO_HIRAGANA),
                 logger=logger,
             )
-            logger.debug(
-                f"okuri_result: okurigana: '{okuri_result.okurigana}', rest_kana:"
-                f" '{okuri_result.rest_kana}', result: '{okuri_result.result}', part_of_speech:"
-                f" '{okuri_result.part_of_speech}'"
-            )
+            if is_debug:
+                logger.debug(
+                    f"okuri_result: okurigana: '{okuri_result.okurigana}', rest_kana:"
+                    f" '{okuri_result.rest_kana}', result: '{okuri_result.result}',"
+                    f" part_of_speech: '{okuri_result.part_of_speech}'"
+                )
             if okuri_result.result != "no_okuri":
                 # We have a valid inflected form, extend end index to include the okurigana
                 logger.debug("Found valid inflected form")
@@ -329,18 +515,7 @@ def word_highlight(text: str, word: str, logger: Logger) -> str:
                 result_indices.append((m.start(0), m.end(0) - len(maybe_okuri)))
 
         # Insert <b> tags into the text at the found indices
-        result = html_free_text
-
-        for idx in range(len(result_indices)):
-            start, end = result_indices[idx]
-            # Increment for tags inside (but not on exact same position) or after the opening tag
-            increment_tag_indexes(start, end)
-            result = result[:start] + "<b>" + result[start:end] + "</b>" + result[end:]
-            logger.debug(f"Result after {idx + 1} <b> insertions: '{result}'")
-            # Adjust subsequent indices due to added tag lengths
-            for j in range(idx + 1, len(result_indices)):
-                s, e = result_indices[j]
-                result_indices[j] = (s + 7, e + 7)
+        result = insert_b_tags(html_free_text, result_indices, increment_tag_indexes)
         logger.debug(f"Intermediate result with <b> tags: '{result}'")
         result = restore_tags(result)
         logger.debug(f"Restored html tags result: '{result}'")
@@ -352,24 +527,19 @@ def word_highlight(text: str, word: str, logger: Logger) -> str:
         word_with_readings_split = split_furi_text_into_individual_kanji_furigana(word)
         logger.debug(f"word_with_readings_split: {word_with_readings_split}")
         # Get the last kanji character and its furigana, while removing it from the split word
-        last_kanji = ""
-        repeater = ""
-        last_kanji_furigana = ""
-
-        def remove_from_split_word(match: re.Match) -> str:
-            nonlocal last_kanji, repeater, last_kanji_furigana
-            last_kanji = match.group(1) if match else ""
-            repeater = match.group(2) if match else ""
-            last_kanji_furigana = match.group(3) if match else ""
+        last_kanji_match = LAST_KANJI_FURIGANA_REC.search(word_with_readings_split)
+        if last_kanji_match:
+            last_kanji, repeater, last_kanji_furigana = last_kanji_match.groups()
+            word_with_readings_split = (
+                word_with_readings_split[: last_kanji_match.start()]
+                + word_with_readings_split[last_kanji_match.end() :]
+            )
             logger.debug(
                 f"Found last kanji in split word: '{last_kanji}', repeater: '{repeater}',"
                 f" last_kanji_furigana: '{last_kanji_furigana}'"
             )
-            return ""
-
-        word_with_readings_split = re.sub(
-            LAST_KANJI_FURIGANA_RE, remove_from_split_word, word_with_readings_split
-        )
+        else:
+            last_kanji = repeater = last_kanji_furigana = ""
 
         logger.debug(
             f" last_kanji: '{last_kanji}', last_kanji_furigana: '{last_kanji_furigana}', "
@@ -393,8 +563,11 @@ def word_highlight(text: str, word: str, logger: Logger) -> str:
             text_with_readings_split, logger=logger
         )
         logger.debug(f"html_free_text for matching: '{html_free_text}', pattern: '{pattern}'")
-        matches = list(re.finditer(pattern, html_free_text))
-        logger.debug(f"Found {len(matches)} matches")
+        matches = get_compiled_regex(pattern).finditer(html_free_text)
+        if is_debug:
+            # Only collect the matches into a list when their count gets logged
+            matches = list(matches)
+            logger.debug(f"Found {len(matches)} matches")
         result_indices: list[tuple[int, int]] = []
         for m in matches:
             # For each match, check if the last kanji's furigana can be inflected to match
@@ -405,89 +578,99 @@ def word_highlight(text: str, word: str, logger: Logger) -> str:
             maybe_okuri = m.group("maybe_okuri")
             if maybe_okuri == ending_okurigana:
                 # Exact match, no inflection needed
-                logger.debug(
-                    f"Exact match found for matched text: '{matched_text}',"
-                    f" maybe_okuri: '{maybe_okuri}'"
-                )
+                if is_debug:
+                    logger.debug(
+                        f"Exact match found for matched text: '{matched_text}',"
+                        f" maybe_okuri: '{maybe_okuri}'"
+                    )
                 result_indices.append((m.start(0), m.end(0)))
                 continue
-            logger.debug(
-                f"Matched text for kana_highlight inflection check: '{matched_text}',"
-                f" maybe_okuri: '{maybe_okuri}', match: {m}"
-            )
+            if is_debug:
+                logger.debug(
+                    f"Matched text for kana_highlight inflection check: '{matched_text}',"
+                    f" maybe_okuri: '{maybe_okuri}', match: {m}"
+                )
+
+            # Convert and locate the okuri once for the checks below
+            hiragana_maybe_okuri = maybe_okuri.translate(KATAKANA_TO_HIRAGANA)
+            okuri_start = m.end(0) - len(maybe_okuri)
 
             # Check if after_last_kanji contains a valid inflection for the ending_okurigana
-            logger.debug(
-                f"Checking inflected forms for last kanji with mecab, last_kanji: '{last_kanji}',"
-                f" last_kanji_furigana: '{last_kanji_furigana}'"
-            )
+            if is_debug:
+                logger.debug(
+                    "Checking inflected forms for last kanji with mecab, last_kanji:"
+                    f" '{last_kanji}', last_kanji_furigana: '{last_kanji_furigana}'"
+                )
 
             if last_kanji and furigana:
                 # furigana should match the last_kanji_furigana, with all variations considered
-                _, reading_match_type = check_reading_match(
+                _, reading_match_type = get_reading_match(
                     reading=last_kanji_furigana,
                     mora_string=furigana,
                     okurigana=maybe_okuri,
                     logger=logger,
                 )
                 if reading_match_type == "none":
-                    logger.debug(
-                        f"Furigana '{furigana}' does not match last kanji furigana"
-                        f" '{last_kanji_furigana}', so no okuri match"
-                    )
+                    if is_debug:
+                        logger.debug(
+                            f"Furigana '{furigana}' does not match last kanji furigana"
+                            f" '{last_kanji_furigana}', so no okuri match"
+                        )
                     kanji_okuri_result = OkuriResults(
                         result="no_okuri", okurigana="", rest_kana="", part_of_speech=""
                     )
                 else:
-                    kanji_okuri_result, _ = get_conjugated_okuri_with_mecab(
+                    kanji_okuri_result, _ = get_word_conjugated_okuri(
                         word=last_kanji,
                         reading=last_kanji_furigana,
-                        maybe_okuri=to_hiragana(maybe_okuri),
-                        okuri_prefix="word",
+                        maybe_okuri=hiragana_maybe_okuri,
                         logger=logger,
                     )
             if kanji_okuri_result.result != "no_okuri":
                 okuri_result = kanji_okuri_result
-                logger.debug(
-                    "Valid inflected form found for last kanji, okurigana:"
-                    f" '{okuri_result.okurigana}'"
-                )
+                if is_debug:
+                    logger.debug(
+                        "Valid inflected form found for last kanji, okurigana:"
+                        f" '{okuri_result.okurigana}'"
+                    )
             else:
-                logger.debug(
-                    "No valid inflected form found for last kanji, trying full word with furigana"
-                    f" '{word_without_furigana}' and furigana '{furigana}'"
-                )
-                word_okuri_result, _ = get_conjugated_okuri_with_mecab(
+                if is_debug:
+                    logger.debug(
+                        "No valid inflected form found for last kanji, trying full word with"
+                        f" furigana '{word_without_furigana}' and furigana '{furigana}'"
+                    )
+                word_okuri_result, _ = get_word_conjugated_okuri(
                     word=word_without_furigana,
                     reading=furigana,
-                    maybe_okuri=to_hiragana(maybe_okuri),
-                    okuri_prefix="word",
+                    maybe_okuri=hiragana_maybe_okuri,
                     logger=logger,
                 )
                 okuri_result = word_okuri_result
-            logger.debug(
-                f"Furigana split okuri_result: okurigana: '{okuri_result.okurigana}', rest_kana:"
-                f" '{okuri_result.rest_kana}', result: '{okuri_result.result}', part_of_speech:"
-                f" '{okuri_result.part_of_speech}'"
-            )
-            if okuri_result.result != "no_okuri":
-                # We have a valid inflected form, extend end index to include the okurigana
+            if is_debug:
                 logger.debug(
-                    "Found valid inflected form with kana_highlight, okurigana:"
-                    f" '{okuri_result.okurigana}', maybe_okuri: '{maybe_okuri}'"
+                    "Furigana split okuri_result: okurigana:"
+                    f" '{okuri_result.okurigana}', rest_kana: '{okuri_result.rest_kana}',"
+                    f" result: '{okuri_result.result}', part_of_speech:"
+                    f" '{okuri_result.part_of_speech}'"
                 )
-                result_indices.append((
-                    m.start(0),
-                    m.end(0) - len(maybe_okuri) + len(okuri_result.okurigana),
-                ))
+            if okuri_result.result != "no_okuri":
+                # We have a valid inflected form, extend end index to include the okurigana
+                if is_debug:
+                    logger.debug(
+                        "Found valid inflected form with kana_highlight, okurigana:"
+                        f" '{okuri_result.okurigana}', maybe_okuri: '{maybe_okuri}'"
+                    )
+                result_indices.append((m.start(0), okuri_start + len(okuri_result.okurigana)))
             else:
                 logger.debug("No valid inflected form found with kana_highlight")
-                result_indices.append((m.start(0), m.end(0) - len(maybe_okuri)))
+                result_indices.append((m.start(0), okuri_start))
 
         # Insert <b> tags into the text at the found indices
         # Extend each end index to include the fixed katakana suffix when present in the text
         if katakana_fixed_suffix:
-            katakana_suffix_re = replace_hiragana_in_pattern(to_hiragana(katakana_fixed_suffix))
+            katakana_suffix_rec = get_compiled_regex(
+                replace_hiragana_in_pattern(hiragana_fixed_suffix)
+            )
             suffix_len = len(katakana_fixed_suffix)
             logger.debug(
                 f"Extending result_indices end by fixed katakana suffix '{katakana_fixed_suffix}'"
@@ -497,17 +680,14 @@ def word_highlight(text: str, word: str, logger: Logger) -> str:
             result_indices = [
                 (start, end + suffix_len)
                 for start, end in result_indices
-                if re.match(katakana_suffix_re, html_free_text[end:])
+                if katakana_suffix_rec.match(html_free_text, end)
             ]
-        result = html_free_text
-        for idx in range(len(result_indices)):
-            start, end = result_indices[idx]
-            increment_tag_indexes(start, end)
-            result = result[:start] + "<b>" + result[start:end] + "</b>" + result[end:]
-            # Adjust subsequent indices due to added tag lengths
-            for j in range(idx + 1, len(result_indices)):
-                s, e = result_indices[j]
-                result_indices[j] = (s + 7, e + 7)
+        if not result_indices:
+            # Like when the word's kanji aren't in the text, return the text without the
+            # furigana splitting and merging changing it
+            logger.debug("No matches found, nothing to highlight")
+            return text
+        result = insert_b_tags(html_free_text, result_indices, increment_tag_indexes)
         logger.debug(f"Intermediate result with <b> tags: '{result}'")
         # Restore tags now, as the tag indexes are based on the split text
         result = restore_tags(result)
@@ -515,7 +695,26 @@ def word_highlight(text: str, word: str, logger: Logger) -> str:
         # Re-merge any consecutive furigana parts that were split earlier
         result = merge_consecutive_furigana(result)
         # Remove space from beginning as it's not required
-        result = re.sub(r"^(<b>)? ", r"\1", result)
+        result = remove_leading_space(result)
         return result
 
     return text
+
+
+def word_highlight_many(text: str, words: list[str], logger: Logger) -> list[str]:
+    """Highlights each of the words separately in the same text with word_highlight.
+
+    The MeCab tokens of the text are shared between the kana only words, so the text is parsed
+    for them only once. The kanji-furigana split of the text is cached, so it's also done once
+    for the words with furigana. Words with okurigana still check each match's okuri with MeCab,
+    though the results are cached per word and okuri.
+
+    Args:
+        text (str): The input text where the words need to be highlighted.
+        words (list[str]): The words to highlight.
+
+    Returns:
+        list[str]: The text with each word highlighted, in the same order as the words.
+    """
+    parsed_tokens: dict[str, list[MecabParsedToken]] = {}
+    return [word_highlight(text, word, logger, parsed_tokens=parsed_tokens) for word in words]
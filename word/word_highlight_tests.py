@@ -1,5 +1,8 @@
 import sys
+import traceback
+from typing import Optional
 
+from ._test_support import DEBUG_LOGGER, VERBOSE_FAIL, cached_highlight
 from .word_highlight import word_highlight
 
 try:
@@ -7,224 +10,209 @@ try:
 except ImportError:
     from ..utils.logger import Logger  # type: ignore[no-redef]
 
-
-def test(
-    test_name: str,
-    text: str,
-    word: str,
-    expected: str = None,
-    ignore_fail: bool = False,
-    debug: bool = False,
-):
-    """Run tests for the word_highlight function.
-    Args:
-        test_name: Name of the test case.
-    """
-    logger = Logger("debug") if debug else Logger("error")
-    try:
-        result = word_highlight(text, word, logger=logger)
-        if debug:
-            print("\n\n")
-        assert result == expected
-    except AssertionError:
-        if ignore_fail:
-            return
-        # Re-run with logging enabled to see what went wrong
-        word_highlight(text, word, logger=Logger("debug"))
-        # Highlight the diff between the expected and the result
-        print(f"""\033[91m{test_name}
-\033[93mExpected: {expected}
-\033[92mGot:      {result}
-\033[0m""")
-        # Stop testing here
-        sys.exit(0)
-    except Exception:
-        # rerun test with logger enabled to see what went wrong
-        print(f"""\033[91mTest "{test_name}" raised an exception.\033[0m""")
-        try:
-            word_highlight(text, word, logger=Logger("debug"))
-        except Exception as e:
-            raise e
+# Test name, expected and result of each failed test case
+FAILURES: list[tuple[str, Optional[str], Optional[str]]] = []
+# Failure report highlighting the diff between the expected and the result
+FAILURE_FORMAT = "\033[91m%s\n\033[93mExpected: %s\n\033[92mGot:      %s\n\033[0m"
+EXCEPTION_FORMAT = '\033[91mTest "%s" raised an exception.\033[0m'
 
 
-def main():
-    test(
+CASES: list[dict] = [
+    dict(
         test_name="Crash test - empty text",
         word="何[なに]",
         text="",
         expected="",
-    )
-    test(
+    ),
+    dict(
         test_name="Crash test - None text",
         word="何[なに]",
         text=None,
         expected=None,
-    )
-    test(
+    ),
+    dict(
         test_name="Crash test - empty word",
         word="",
         text="何[なに]を しています か？",
         expected="何[なに]を しています か？",
-    )
-    test(
+    ),
+    dict(
         test_name="Crash test - None word",
         word=None,
         text="何[なに]を しています か？",
         expected="何[なに]を しています か？",
-    )
-    test(
+    ),
+    dict(
         test_name="Crash test - word is just whitespace",
         word="   ",
         text="何[なに]を しています か？",
         expected="何[なに]を しています か？",
-    )
-    test(
+    ),
+    dict(
+        test_name="No match - kanji of word not in text",
+        word="家[いえ]",
+        text=" 魚[うお] 市場[いちば]は 日本[にほん]に",
+        expected=" 魚[うお] 市場[いちば]は 日本[にほん]に",
+    ),
+    dict(
+        test_name="No match - kanji of word in text with other furigana",
+        word="本[もと]",
+        text=" 魚[うお] 市場[いちば]は 日本[にほん]に",
+        expected=" 魚[うお] 市場[いちば]は 日本[にほん]に",
+    ),
+    dict(
+        test_name="No match - kanji of inflectable word in text with other furigana",
+        word="本[もと]づく",
+        text=" 魚[うお] 市場[いちば]は 日本[にほん]に",
+        expected=" 魚[うお] 市場[いちば]は 日本[にほん]に",
+    ),
+    dict(
         test_name="Furigana - non-inflected noun in middle of text",
         word="日本語[にほんご]",
         text="私[わたし]は 日本語[にほんご]を 勉強[べんきょう]しています。",
         expected="私[わたし]は<b> 日本語[にほんご]</b>を 勉強[べんきょう]しています。",
-    )
-    test(
+    ),
+    dict(
         test_name="Furigana - non-inflected single-kanji noun",
         word="家[いえ]",
         text="家[いえ]で 居[い]る",
         expected="<b>家[いえ]</b>で 居[い]る",
-    )
-    test(
+    ),
+    dict(
         test_name="Furigana - non-inflected multi-kanji noun",
         word="魚市場[うおいちば]",
         text="この 魚[さかな]は 魚市場[うおいちば]で 買[か]った",
         expected="この 魚[さかな]は<b> 魚市場[うおいちば]</b>で 買[か]った",
-    )
-    test(
+    ),
+    dict(
         test_name="Furigana - non-inflected repeater noun",
         # Also missing furigana for one word to test that it still works
         word="人々[ひとびと]",
         text="彼[かれ]は 人々[ひとびと]の 中で 目立[めだ]つ",
         expected="彼[かれ]は<b> 人々[ひとびと]</b>の 中で 目立[めだ]つ",
-    )
-    test(
+    ),
+    dict(
         test_name="Furigana - non-inflected multi-kanji noun where word is split in text",
         word="魚市場[うおいちば]",
         text="<k> 此[こ]の</k> 魚[さかな]は 魚[うお]市場[いちば]で 買[か]いました。",
         # Will change the original text structure slightly by merging the furigana parts
         expected="<k> 此[こ]の</k> 魚[さかな]は<b> 魚市場[うおいちば]</b>で 買[か]いました。",
-    )
-    test(
+    ),
+    dict(
         test_name=(
             "Furigana - non-inflected single-kanji noun as part of larger word in text, left side"
         ),
         word="魚[うお]",
         text="この 魚[さかな]は 魚市場[うおいちば]で 買[か]った",
         expected="この 魚[さかな]は<b> 魚[うお]</b> 市場[いちば]で 買[か]った",
-    )
-    test(
+    ),
+    dict(
         test_name=(
             "Furigana - non-inflected multi-kanji noun as part of larger word in text, right side"
         ),
         word="時間[じかん]",
         text="労働時間[ろうどうじかん]を 減[へ]らしたい",
         expected="労働[ろうどう]<b> 時間[じかん]</b>を 減[へ]らしたい",
-    )
-    test(
+    ),
+    dict(
         test_name=(
             "Furigana - non-inflected multi-kanji noun as part of larger word in text, middle"
         ),
         word="専用[せんよう]",
         text="バイクを 自転車専用道路[じてんしゃせんようどうろ]で 走[はし]らせる",
         expected="バイクを 自転車[じてんしゃ]<b> 専用[せんよう]</b> 道路[どうろ]で 走[はし]らせる",
-    )
-    test(
+    ),
+    dict(
         test_name="Furigana - inflected verb as part of larger verb in text",
         word="付[つ]ける",
         text="彼女[かのじょ]への 伝言[でんごん]を 言付[ことづ]けたの。",
         expected="彼女[かのじょ]への 伝言[でんごん]を 言[こと]<b> 付[づ]けた</b>の。",
-    )
-    test(
+    ),
+    dict(
         test_name="Furigana - inflected verb occurring in noun form and verb form in text",
         word="引[ひ]く",
         text="<k> 此[こ]の</k> 漢字[かんじ]を 字引[じびき]で 引[ひ]いてみて。",
         expected="<k> 此[こ]の</k> 漢字[かんじ]を 字[じ]<b> 引[びき]</b>で<b> 引[ひ]いて</b>みて。",
-    )
-    test(
+    ),
+    dict(
         test_name="Furigana - verb inflection ている /1",
         word="食[た]べる",
         text="私は 食[た]べている",
         expected="私は<b> 食[た]べている</b>",
-    )
-    test(
+    ),
+    dict(
         test_name="Furigana - verb inflection させる /1",
         word="食[た]べる",
         text="食[た]べさせるな!",
         expected="<b>食[た]べさせる</b>な!",
-    )
-    test(
+    ),
+    dict(
         test_name="Furigana - verb inflection juku word /1",
         word="聴牌[テンパ]る",
         text="聴牌[テンパ]ってた",
         expected="<b>聴牌[テンパ]ってた</b>",
-    )
-    test(
+    ),
+    dict(
         test_name="Furigana - adjective inflection /1",
         word="大[おお]きい",
         text="これ、 大[おお]きすぎない？",
         expected="これ、<b> 大[おお]き</b>すぎない？",
-    )
-    test(
+    ),
+    dict(
         test_name="Furigana - adjective inflection /2",
         word="安[やす]い",
         text="安[やす]くて 良[い]いな～",
         expected="<b>安[やす]くて</b> 良[い]いな～",
-    )
-    test(
+    ),
+    dict(
         test_name="Furigana - adjective inflection /3",
         word="良[よ]い",
         text="高[たか]いでも 良[よ]かろう",
         expected="高[たか]いでも<b> 良[よ]かろう</b>",
-    )
-    test(
+    ),
+    dict(
         test_name="Furigana - adjective inflection with な /1",
         word="早[はや]い",
         text="早読[はやよ]みするぜ",
         expected="<b>早[はや]</b> 読[よ]みするぜ",
-    )
-    test(
+    ),
+    dict(
         test_name="Furigana is in katakana in text, word in hiragana",
         word="垂[た]れ 込[こ]み",
         text="垂[タ]レ 込[コ]ミがあった、オイ！",
         expected="<b>垂[タ]レ 込[コ]ミ</b>があった、オイ！",
-    )
-    test(
+    ),
+    dict(
         test_name="Furigana is in hiragana in text, word in katakana",
         word="垂[タ]レ 込[コ]ミ",
         text="垂[た]れ 込[こ]みがあった",
         expected="<b>垂[た]れ 込[こ]み</b>があった",
-    )
-    test(
+    ),
+    dict(
         test_name="Furigana - multi-kanji noun with okuri in middle /1",
         word="髪[かみ]の 毛[け]",
         text="彼女[かのじょ]の 髪[かみ]の 毛[け]は 長[なが]い",
         expected="彼女[かのじょ]の<b> 髪[かみ]の 毛[け]</b>は 長[なが]い",
-    )
-    test(
+    ),
+    dict(
         test_name="Furigana - multi-kanji noun with okuri in middle /2",
         word="飲[の]ん 兵衛[べえ]",
         text="彼[かれ]は 飲[の]ん 兵衛[べえ]だ",
         expected="彼[かれ]は<b> 飲[の]ん 兵衛[べえ]</b>だ",
-    )
-    test(
+    ),
+    dict(
         test_name="Furigana - word occurs more than once, simple match",
         word="彼[かれ]",
         text="彼[かれ]は 走[はし]った。彼[かれ]は 速[はや]い。",
         expected="<b>彼[かれ]</b>は 走[はし]った。<b> 彼[かれ]</b>は 速[はや]い。",
-    )
-    test(
+    ),
+    dict(
         test_name="Furigana - word occurs more than once, inflected match",
         word="走[はし]る",
         text="彼[かれ]は 走[はし]った。 彼[かれ]の 走[はし]り 方[かた]は 速[はや]い。",
         expected="彼[かれ]は<b> 走[はし]った</b>。 彼[かれ]の<b> 走[はし]り</b> 方[かた]は 速[はや]い。",
-    )
-    test(
+    ),
+    dict(
         test_name="Furigana - word is split by html tags in text /1",
         word="何[なん]でも 無[な]い",
         text=(
@@ -237,8 +225,8 @@ def main():
             "でも<k> 無[な]い</k></b> 女[おんな]の 会話[かいわ]。」</div><div>「<k> 其[そ]れ</k>、"
             " 特大[とくだい]ブーメランじゃねぇ？」</div>"
         ),
-    )
-    test(
+    ),
+    dict(
         test_name="Furigana - word is split by html tags in text /2",
         word="花一匁[はないちもんめ]",
         text=(
@@ -249,8 +237,8 @@ def main():
             "<k> 此[こ]れ</k>ってなんか<b> 花[はな]<k> 一匁[いちもんめ]</k></b>だっけ？<k>"
             " 彼[あれ]</k><k> 位[ぐらい]</k>の<k> 乗[ノリ]</k>？"
         ),
-    )
-    test(
+    ),
+    dict(
         test_name="Furigana - word with repeater and okuri",
         word="嬉々[きき]として",
         text=(
@@ -263,8 +251,8 @@ def main():
             " 此[こ]れ</k>ら<k> 糞[クソ]</k>ゲーを<b> 嬉々[きき]として</b> 求[もと]める 者[もの]<k>"
             " 達[たち]</k>"
         ),
-    )
-    test(
+    ),
+    dict(
         test_name="Furigana - tags in text, inflectable word /1",
         word="火照[ほて]る",
         text=(
@@ -275,8 +263,8 @@ def main():
             "<k> 然[しか]し</k>... 今日[きょう]はマジで 暑[あつ]いな。 何[なに]か... 凄[すご]い..."
             " 身体[からだ]が<b> 火照[ほて]る</b>"
         ),
-    )
-    test(
+    ),
+    dict(
         test_name="Furigana - tags in text, inflectable word /2",
         word="褒[ほ]める",
         text=(
@@ -289,8 +277,8 @@ def main():
             " 褒[ほ]め</b>の<k> 御[お]</k> 言葉[ことば]<k> 有難[ありがと]う</k><k>"
             " 御座[ござ]います</k>》</div>"
         ),
-    )
-    test(
+    ),
+    dict(
         test_name="Furigana - tags in text, inflected verb /3",
         word="護[まも]る",
         text=(
@@ -301,8 +289,8 @@ def main():
             "<k> 其々[それぞれ]</k>の 戦[たたか]い 方[かた]で<k> 此[こ]れ</k>からも 共[とも]に"
             " 人々[ひとびと]を<b> 護[まも]りましょう</b>"
         ),
-    )
-    test(
+    ),
+    dict(
         test_name="Furigana - combination of furigana word and katakana word",
         word="十徳[じゅっとく]ナイフ",
         text=(
@@ -313,108 +301,108 @@ def main():
             "<k> 止[や]めた</k> 方[ほう]が<k> 良[い]い</k>、 貴方[あなた]の 持[も]っている"
             "<b> 十徳[じゅっとく]ナイフ</b>じゃ 私[わたし]には 勝[か]てない"
         ),
-    )
-    test(
+    ),
+    dict(
         test_name="Furigana - combination of furigana word with okurigana and katakana word",
         word="彫[ほ]りナイフ",
         text="塑像[そぞう]を 彫[ほ]りナイフで 彫[ほ]るのは 安[やす]いね。",
         expected="塑像[そぞう]を<b> 彫[ほ]りナイフ</b>で 彫[ほ]るのは 安[やす]いね。",
-    )
-    test(
+    ),
+    dict(
         test_name="Furigana is colloquial /1",
         # Needs some kind of exception handling, can only work when furigana are used
         word="無[ない]",
         text="無[ねえ]な",
         expected="<b>無[ねえ]な</b>",
         ignore_fail=True,
-    )
-    test(
+    ),
+    dict(
         test_name="Furigana word containing ヶ in middle 1/",
         word="幡ヶ谷[はたがや]",
         text="幡ヶ谷[はたがや]で 待[ま]ち 合[あ]わせ",
         expected="<b>幡ヶ谷[はたがや]</b>で 待[ま]ち 合[あ]わせ",
-    )
-    test(
+    ),
+    dict(
         test_name="Furigana word containing ヶ in middle 2/",
         word="一ヶ月[いっかげつ]",
         text="一ヶ月[いっかげつ]で 仕上[しあ]げる",
         expected="<b>一ヶ月[いっかげつ]</b>で 仕上[しあ]げる",
-    )
-    test(
+    ),
+    dict(
         test_name="Furigana word containing ヶ in start 1/",
         word="ヶ月[かげつ]",
         text="一ヶ月[いっかげつ]で 仕上[しあ]げる",
         expected="一[いっ]<b> ヶ月[かげつ]</b>で 仕上[しあ]げる",
-    )
-    test(
+    ),
+    dict(
         test_name="Furigana word containing ヵ in middle 1/",
         word="一ヵ月[いっかげつ]",
         text="一ヵ月[いっかげつ]で 仕上[しあ]げる",
         expected="<b>一ヵ月[いっかげつ]</b>で 仕上[しあ]げる",
-    )
-    test(
+    ),
+    dict(
         test_name="Furigana word containing ヵ in start 1/",
         word="ヵ月[かげつ]",
         text="一ヵ月[いっかげつ]で 仕上[しあ]げる",
         expected="一[いっ]<b> ヵ月[かげつ]</b>で 仕上[しあ]げる",
-    )
-    test(
+    ),
+    dict(
         test_name="No furigana with kanji - single-kanji noun multiple occurrences",
         word="家",
         text="家で居る、家出はしない",
         expected="<b>家</b>で居る、<b>家</b>出はしない",
-    )
-    test(
+    ),
+    dict(
         test_name="No furigana with kanji - multi-kanji noun",
         word="魚市場",
         text="この魚は魚市場で買った",
         expected="この魚は<b>魚市場</b>で買った",
-    )
-    test(
+    ),
+    dict(
         test_name="No furigana with kanji - multi-kanji noun with okuri in middle /1",
         word="髪の毛",
         text="彼女の髪の毛は長い",
         expected="彼女の<b>髪の毛</b>は長い",
-    )
-    test(
+    ),
+    dict(
         test_name="No furigana with kanji - multi-kanji noun with okuri in middle /2",
         word="飲ん兵衛",
         text="彼は飲ん兵衛だ",
         expected="彼は<b>飲ん兵衛</b>だ",
-    )
-    test(
+    ),
+    dict(
         test_name="No furigana with kanji - verb inflection /1",
         word="食べる",
         text="彼は食べている",
         expected="彼は<b>食べている</b>",
-    )
-    test(
+    ),
+    dict(
         test_name="No furigana with kanji - verb inflection /2",
         word="苛めめる",
         text="苛めなくていれないのか、お 前は？",
         expected="<b>苛めなくて</b>いれないのか、お 前は？",
-    )
-    test(
+    ),
+    dict(
         test_name=(
             "No furigana with kanji - inflected verb occurring in noun form and verb form in text"
         ),
         word="引く",
         text="<k>此の</k>漢字を字引で引いてみて。",
         expected="<k>此の</k>漢字を字<b>引</b>で<b>引いて</b>みて。",
-    )
-    test(
+    ),
+    dict(
         test_name="No furigana with kanji - adjective inflection /1",
         word="美味しい",
         text="このケーキ、美味しくない？",
         expected="このケーキ、<b>美味しくない</b>？",
-    )
-    test(
+    ),
+    dict(
         test_name="No furigana with kanji - adjective inflection /2",
         word="美味しい",
         text="このケーキって、美味しくなくて 残念だったな！",
         expected="このケーキって、<b>美味しくなくて</b> 残念だったな！",
-    )
-    test(
+    ),
+    dict(
         test_name="No furigana with kanji - word is split by html tags in text /1",
         word="何でも無い",
         text=(
@@ -425,14 +413,14 @@ def main():
             "<div>「<k>糞</k><k>程</k><k>詰らん</k>。<b><k>何</k>でも<k>無い</k></b>女の会話。"
             "」</div><div>「<k>其れ</k>、特大ブーメランじゃねぇ？」</div>"
         ),
-    )
-    test(
+    ),
+    dict(
         test_name="No furigana with kanji - word is split by html tags in text /2",
         word="花一匁",
         text="<k>此れ</k>ってなんか花<k>一匁</k>だっけ？<k>彼</k><k>位</k>の<k>乗</k>？",
         expected="<k>此れ</k>ってなんか<b>花<k>一匁</k></b>だっけ？<k>彼</k><k>位</k>の<k>乗</k>？",
-    )
-    test(
+    ),
+    dict(
         test_name="No furigana with kanji - word with repeater and okuri",
         word="嬉々として",
         text=(
@@ -445,14 +433,14 @@ def main():
             "此れ</k>ら<k>糞</k>ゲーを<b>嬉々として</b>求める者<k>"
             "達</k>"
         ),
-    )
-    test(
+    ),
+    dict(
         test_name="No furigana with kanji - tags in text, inflectable word /1",
         word="火照る",
         text="<k>然し</k>...今日はマジで暑いな。何か...凄い...身体が火照る",
         expected="<k>然し</k>...今日はマジで暑いな。何か...凄い...身体が<b>火照る</b>",
-    )
-    test(
+    ),
+    dict(
         test_name="No furigana with kanji - tags in text, inflectable word /2",
         word="褒める",
         text=(
@@ -463,45 +451,45 @@ def main():
             "《咄嗟の障壁<k>巧い</k>ね》<br><div>《<k>御</k><b>褒め</b>の<k>御</k>言葉"
             "<k>有難う</k><k>御座います</k>》</div>"
         ),
-    )
-    test(
+    ),
+    dict(
         test_name="No furigana with kanji - tags in text, inflected verb /3",
         word="護る",
         text="<k>其々</k>の戦い方で<k>此れ</k>からも共に人々を護りましょう",
         expected="<k>其々</k>の戦い方で<k>此れ</k>からも共に人々を<b>護りましょう</b>",
-    )
-    test(
+    ),
+    dict(
         test_name="No furigana with kanji - word containing ヶ 1/",
         word="幡ヶ谷",
         text="幡ヶ谷で待ち合わせ",
         expected="<b>幡ヶ谷</b>で待ち合わせ",
-    )
-    test(
+    ),
+    dict(
         test_name="No furigana with kanji - word containing ヶ 2/",
         word="一ヶ月",
         text="一ヶ月で仕上げる",
         expected="<b>一ヶ月</b>で仕上げる",
-    )
-    test(
+    ),
+    dict(
         test_name="No furigana with kanji - word containing ヵ 1/",
         word="一ヵ月",
         text="一ヵ月で仕上げる",
         expected="<b>一ヵ月</b>で仕上げる",
-    )
+    ),
     # Mixing in katakana with the kana-only tests below to ensure conversion back to hiragana works
-    test(
+    dict(
         test_name="Kana only - katakana word in text, word in hiragana",
         word="たれこみ",
         text="タレコミがあった",
         expected="<b>タレコミ</b>があった",
-    )
-    test(
+    ),
+    dict(
         test_name="Kana only - hiragana word in text, word in katakana",
         word="タレコミ",
         text="たれこみがあった",
         expected="<b>たれこみ</b>があった",
-    )
-    test(
+    ),
+    dict(
         test_name="Kana only - katakana in word and text",
         word="マスターページョン",
         text=(
@@ -513,26 +501,33 @@ def main():
             " 勃[た]ちでスタンティングオペレーションじゃなくて<b>マスターページョン</b>始[はじ]"
             "まっちゃうね。"
         ),
-    )
-    test(
+    ),
+    dict(
         test_name="Kana only - verb inflection /2",
         word="いじめる",
         text="いじめなくていれないのか、お 前[オマエ]は？",
         expected="<b>いじめなくて</b>いれないのか、お 前[オマエ]は？",
-    )
-    test(
+    ),
+    dict(
         test_name="Kana only - adjective inflection /1",
         word="おいしい",
         text="このケーキ、おいしくない？",
         expected="このケーキ、<b>おいしくない</b>？",
-    )
-    test(
+    ),
+    dict(
         test_name="Kana only - adjective inflection /2",
         word="おいしい",
         text="このケーキって、おいしくなくて 残念[ザンねん]だったな！",
         expected="このケーキって、<b>おいしくなくて</b> 残念[ザンねん]だったな！",
-    )
-    test(
+    ),
+    dict(
+        test_name="Kana only - noun form of verb",
+        word="まもり",
+        # The noun form isn't in the text as is, so the inflected form is found with MeCab
+        text="人々をまもって",
+        expected="人々を<b>まもって</b>",
+    ),
+    dict(
         test_name="Kana only - kanji only & tags in text, inflectable word /1",
         word="めげる",
         text=(
@@ -545,8 +540,8 @@ def main():
             "寒いんだよね。行きたくないなぁ…。"
             "」</div>「もう<b>めげ</b>始めている…」<br>"
         ),
-    )
-    test(
+    ),
+    dict(
         test_name="Kana only - kanji only & tags in text, inflectable word /2",
         word="ほめる",
         text=(
@@ -557,20 +552,20 @@ def main():
             "《咄嗟の障壁<k>巧い</k>ね》<br><div>《お<b>ほめ</b>の<k>"
             "御</k>言葉<k>有難う</k><k>御座います</k>》</div>"
         ),
-    )
-    test(
+    ),
+    dict(
         test_name="Kana only - kanji only & tags in text, inflectable word /3",
         word="まもる",
         text="<k>其々</k>の戦い方で<k>此れ</k>からも共に人々をまもりましょう",
         expected="<k>其々</k>の戦い方で<k>此れ</k>からも共に人々を<b>まもりましょう</b>",
-    )
-    test(
+    ),
+    dict(
         test_name="Kana only - kanji only & tags in text, inflectable word /4",
         word="はにかむ",
         text="「<k>彼の</k>はにかんだ笑顔が<k>如何</k>にも頭に残る」",
         expected="「<k>彼の</k><b>はにかんだ</b>笑顔が<k>如何</k>にも頭に残る」",
-    )
-    test(
+    ),
+    dict(
         test_name="Kana only - kanji only & tags in text, inflectable word /1",
         word="めげる",
         text=(
@@ -583,8 +578,8 @@ def main():
             " 寒[さむ]いんだよね。 行[い]きたくないなぁ…。"
             "」</div>「もう<b>めげ</b>始[はじ]めている…」<br>"
         ),
-    )
-    test(
+    ),
+    dict(
         test_name="Kana only - furigana & tags in text, inflectable word /2",
         word="ほめる",
         text=(
@@ -595,8 +590,8 @@ def main():
             "《 咄嗟[とっさ]の 障壁[しょうへき]<k> 巧[うま]い</k>ね》<br><div>《お<b>ほめ</b>の<k>"
             " 御[お]</k> 言葉[ことば]<k> 有難[ありがと]う</k><k> 御座[ござ]います</k>》</div>"
         ),
-    )
-    test(
+    ),
+    dict(
         test_name="Kana only - furigana & tags in text, inflectable word /3",
         word="まもる",
         text=(
@@ -607,8 +602,8 @@ def main():
             "<k> 其々[それぞれ]</k>の 戦[たたか]い 方[かた]で<k> 此[こ]れ</k>からも 共[とも]に"
             " 人々[ひとびと]を<b>まもりましょう</b>"
         ),
-    )
-    test(
+    ),
+    dict(
         test_name="Kana only - furigana & tags in text, inflectable word /4",
         word="はにかむ",
         text="「<k> 彼[あ]の</k>はにかんだ 笑顔[えがお]が<k> 如何[どう]</k>にも 頭[あたま]に 残[のこ]る」",
@@ -616,14 +611,54 @@ def main():
             "「<k> 彼[あ]の</k><b>はにかんだ</b> 笑顔[えがお]が<k> 如何[どう]</k>にも 頭[あたま]に"
             " 残[のこ]る」"
         ),
-    )
-    test(
+    ),
+    dict(
         test_name="Shouldn't crash with mixture of furigana and non-furigana in word",
         word="総[そう]勃ち",
         text="こんな 見[み]たら 観客[かんきゃく] 座[すわ]ってるのに 総[そう]勃ち だよ",
         # Might not always highlight correctly, though this one does, but at least shouldn't crash
         expected="こんな 見[み]たら 観客[かんきゃく] 座[すわ]ってるのに<b> 総[そう]勃ち</b> だよ",
-    )
+    ),
+]
+
+
+def run_case(case: dict) -> tuple[Optional[str], list[str], Optional[str]]:
+    """Runs a test case once, returning its result, the debug messages of the run and the
+    traceback of the exception it raised, if any. The debug messages are only collected when
+    failures are reported verbosely."""
+    trace: list[str] = []
+    try:
+        if case.get("debug"):
+            result = word_highlight(case["text"], case["word"], logger=DEBUG_LOGGER)
+            print("\n\n")
+        elif VERBOSE_FAIL:
+            logger = Logger("debug", log=trace.append)
+            result = word_highlight(case["text"], case["word"], logger=logger)
+        else:
+            result = cached_highlight(case["text"], case["word"])
+    except Exception:
+        return None, trace, traceback.format_exc()
+    return result, trace, None
+
+
+def main():
+    for case in CASES:
+        test_name, expected = case["test_name"], case.get("expected")
+        result, trace, error = run_case(case)
+        if error is None and (result == expected or case.get("ignore_fail")):
+            continue
+        if error is not None:
+            print(EXCEPTION_FORMAT % test_name)
+        if trace:
+            # Show the debug messages of the run to see what went wrong
+            print("\n".join(trace))
+        # Keep testing and report all the failures at the end
+        FAILURES.append((test_name, expected, error if error is not None else result))
+    if FAILURES:
+        # Write all the failures at once
+        sys.stdout.write("".join(FAILURE_FORMAT % failure + "\n" for failure in FAILURES))
+        sys.stdout.flush()
+        sys.exit(1)
     print("\n\033[92mTests passed\033[0m")
 
 
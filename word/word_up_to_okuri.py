@@ -1,21 +1,25 @@
 import sys
 import re
 from dataclasses import dataclass
+from functools import lru_cache
 
 try:
     from regex.kanji_furi import (
         KANJI_AND_FURIGANA_AND_OKURIGANA_RE,
+        KANJI_AND_FURIGANA_AND_OKURIGANA_REC,
     )
 except ImportError:
     from ..regex.kanji_furi import (
         KANJI_AND_FURIGANA_AND_OKURIGANA_RE,
+        KANJI_AND_FURIGANA_AND_OKURIGANA_REC,
     )
 
 WORD_SPLIT_RE = rf"^(.*?) ?{KANJI_AND_FURIGANA_AND_OKURIGANA_RE}$"
 WORD_SPLIT_REC = re.compile(WORD_SPLIT_RE)
 
 
-@dataclass
+# Frozen as the results are cached and shared between calls
+@dataclass(frozen=True, slots=True)
 class WordSplitResult:
     before: str
     kanji: str
@@ -23,6 +27,8 @@ class WordSplitResult:
     okurigana: str
 
 
+# The same words get split repeatedly
+@lru_cache(maxsize=4096)
 def word_up_to_okuri(
     word: str,
 ) -> WordSplitResult:
@@ -30,17 +36,18 @@ def word_up_to_okuri(
     Split a furigana syntax word into the uninflected part and the kanji + okurigana part that
     can be inflected.
     """
-    # Find all matches of the kanji-furigana pattern
-    import re
+    # Without any [, such as in kana only words, the kanji-furigana pattern can't match
+    if "[" not in word:
+        return WordSplitResult(before=word, kanji="", furigana="", okurigana="")
 
-    matches = list(re.finditer(KANJI_AND_FURIGANA_AND_OKURIGANA_RE, word))
+    # Find the last match (rightmost furigana pattern) of the kanji-furigana pattern
+    last_match = None
+    for last_match in KANJI_AND_FURIGANA_AND_OKURIGANA_REC.finditer(word):
+        pass
 
-    if not matches:
+    if not last_match:
         return WordSplitResult(before=word, kanji="", furigana="", okurigana="")
 
-    # Get the last match (rightmost furigana pattern)
-    last_match = matches[-1]
-
     # Everything before the last match
     before = word[: last_match.start()].rstrip()
 
@@ -49,14 +56,12 @@ def word_up_to_okuri(
     furigana = last_match.group(2) or ""
     okurigana = last_match.group(3) or ""
 
-    # Now manually check characters after the "before" part until we reach the kanji
+    # Now extend the "before" part with the characters after it until we reach the kanji
     # This handles spaces and other characters that should be part of "before"
-    current_pos = len(before)
-
-    # Skip forward until we find the first character of the kanji
-    while current_pos < len(word) and kanji and word[current_pos] != kanji[0]:
-        before += word[current_pos]
-        current_pos += 1
+    if kanji:
+        # Skip forward until we find the first character of the kanji
+        kanji_index = word.find(kanji[0], len(before))
+        before = word[: kanji_index if kanji_index != -1 else len(word)]
 
     return WordSplitResult(before=before, kanji=kanji, furigana=furigana, okurigana=okurigana)
 